@@ -0,0 +1,47 @@
+import matplotlib.pyplot as plt
+
+from scheduling import Process, cfs
+from scheduling.render import draw_gantt
+
+# List of processes with attributes: (Process ID, Priority, Burst Time, Arrival Time)
+# Priority is used as the nice level: lower value gets a larger share of the CPU
+processes = [
+    ("P1", 8, 15, 0),
+    ("P2", 3, 20, 0),
+    ("P3", 4, 20, 20),
+    ("P4", 4, 20, 25),
+    ("P5", 5, 5, 45),
+    ("P6", 5, 15, 55)
+]
+
+# Scheduling period and the shortest slice a process may get
+target_latency = 20
+min_granularity = 4
+
+
+# Function to display results in a table format
+def print_table(schedule):
+    print(f"Completely Fair Scheduling Results with Target Latency = {target_latency}, Minimum Granularity = {min_granularity}")
+    print(f"{'Process':<10}{'Arrival Time':<15}{'Burst Time':<15}{'Priority':<10}{'Completion Time':<20}{'Turnaround Time':<20}{'Waiting Time':<15}")
+    for p, completion, turnaround, waiting in zip(schedule.workload.records(), schedule.completion.tolist(), schedule.turnaround.tolist(), schedule.waiting.tolist()):
+        print(f"{p.pid:<10}{p.arrival:<15}{p.burst:<15}{p.priority:<10}{completion:<20}{turnaround:<20}{waiting:<15}")
+
+
+# Function to plot the Gantt chart
+def plot_gantt_chart(schedule):
+    fig, gnt = plt.subplots(figsize=(12, 4))
+    draw_gantt(gnt, schedule, "Gantt Chart for Completely Fair Scheduling")
+
+    # Show Gantt chart
+    plt.tight_layout()
+    plt.show()
+
+
+def main():
+    schedule = cfs((Process(pid, arrival, burst, priority) for pid, priority, burst, arrival in processes), target_latency, min_granularity)
+    print_table(schedule)
+    plot_gantt_chart(schedule)
+
+
+if __name__ == "__main__":
+    main()
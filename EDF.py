@@ -0,0 +1,49 @@
+import matplotlib.pyplot as plt
+
+from scheduling import Process, edf, llf, summarize
+from scheduling.render import draw_gantt
+
+# List of processes with attributes: (Process ID, Burst Time, Arrival Time, Deadline)
+processes = [
+    ("P1", 15, 0, 40),
+    ("P2", 20, 0, 25),
+    ("P3", 20, 20, 60),
+    ("P4", 20, 25, 70),
+    ("P5", 5, 45, 55),
+    ("P6", 15, 55, 90)
+]
+
+
+# Function to display results in a table format, with each process's lateness and the miss rate
+def print_table(schedule, title):
+    print(f"{title} Results")
+    print(f"{'Process':<10}{'Arrival Time':<15}{'Burst Time':<15}{'Deadline':<10}{'Completion Time':<20}{'Turnaround Time':<20}{'Waiting Time':<15}{'Lateness':<10}{'Missed':<8}")
+    for p, completion, turnaround, waiting, lateness in zip(schedule.workload.records(), schedule.completion.tolist(), schedule.turnaround.tolist(), schedule.waiting.tolist(), schedule.lateness.tolist()):
+        print(f"{p.pid:<10}{p.arrival:<15}{p.burst:<15}{p.deadline:<10}{completion:<20}{turnaround:<20}{waiting:<15}{lateness:<10}{'yes' if lateness > 0 else 'no':<8}")
+    print(f"Deadline miss rate: {summarize(schedule)['miss_rate']:.2%}\n")
+
+
+# Function to plot the Gantt charts, one per policy
+def plot_gantt_chart(schedules):
+    fig, axes = plt.subplots(len(schedules), 1, figsize=(12, 4 * len(schedules)))
+    for gnt, (title, schedule) in zip(axes, schedules):
+        draw_gantt(gnt, schedule, f"Gantt Chart for {title}")
+
+    # Show Gantt chart
+    plt.tight_layout()
+    plt.show()
+
+
+def main():
+    records = [Process(pid, arrival, burst, deadline=deadline) for pid, burst, arrival, deadline in processes]
+    schedules = [
+        ("Earliest Deadline First Scheduling", edf(records)),
+        ("Least Laxity First Scheduling", llf(records)),
+    ]
+    for title, schedule in schedules:
+        print_table(schedule, title)
+    plot_gantt_chart(schedules)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import matplotlib.pyplot as plt
+
+from scheduling import Process, lottery, stride
+from scheduling.render import draw_gantt
+
+# List of processes with attributes: (Process ID, Priority, Burst Time, Arrival Time)
+# Priority is used as the nice level: lower value holds more tickets
+processes = [
+    ("P1", 8, 15, 0),
+    ("P2", 3, 20, 0),
+    ("P3", 4, 20, 20),
+    ("P4", 4, 20, 25),
+    ("P5", 5, 5, 45),
+    ("P6", 5, 15, 55)
+]
+
+# Time quantum
+time_quantum = 5
+
+
+# Function to display results in a table format
+def print_table(schedule, title):
+    print(f"{title} Results with Time Quantum = {time_quantum}")
+    print(f"{'Process':<10}{'Arrival Time':<15}{'Burst Time':<15}{'Priority':<10}{'Completion Time':<20}{'Turnaround Time':<20}{'Waiting Time':<15}")
+    for p, completion, turnaround, waiting in zip(schedule.workload.records(), schedule.completion.tolist(), schedule.turnaround.tolist(), schedule.waiting.tolist()):
+        print(f"{p.pid:<10}{p.arrival:<15}{p.burst:<15}{p.priority:<10}{completion:<20}{turnaround:<20}{waiting:<15}")
+    print()
+
+
+# Function to plot the Gantt charts, one per policy
+def plot_gantt_chart(schedules):
+    fig, axes = plt.subplots(len(schedules), 1, figsize=(12, 4 * len(schedules)))
+    for gnt, (title, schedule) in zip(axes, schedules):
+        draw_gantt(gnt, schedule, f"Gantt Chart for {title}")
+
+    # Show Gantt chart
+    plt.tight_layout()
+    plt.show()
+
+
+def main():
+    records = [Process(pid, arrival, burst, priority) for pid, priority, burst, arrival in processes]
+    schedules = [
+        ("Stride Scheduling", stride(records, time_quantum)),
+        ("Lottery Scheduling", lottery(records, time_quantum, seed=0)),
+    ]
+    for title, schedule in schedules:
+        print_table(schedule, title)
+    plot_gantt_chart(schedules)
+
+
+if __name__ == "__main__":
+    main()
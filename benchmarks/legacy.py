@@ -0,0 +1,143 @@
+# The original per-script scheduling loops, kept as benchmark baselines. They take lists of
+# arrival, burst and priority values and return completion times in input order. Several of
+# them hang on some inputs (noted below); the benchmark runner enforces a timeout.
+import threading
+import time as clock
+
+
+# FCFS.py: one thread per process polling a shared clock. Never finishes if the earliest
+# arrival is after 0, since the clock only moves when a process runs.
+def fcfs_threads(arrival, burst, priority):
+    n = len(arrival)
+    order = sorted(range(n), key=lambda i: arrival[i])
+    completion = [0] * n
+    lock = threading.Lock()
+    state = {"current_time": 0}
+
+    def run_process(i):
+        while state["current_time"] < arrival[i]:
+            clock.sleep(0.1)
+        with lock:
+            start_time = max(state["current_time"], arrival[i])
+            state["current_time"] = start_time + burst[i]
+            completion[i] = state["current_time"]
+
+    threads = [threading.Thread(target=run_process, args=(i,)) for i in order]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return completion
+
+
+# RR.py: sweep every process on each pass. Spins if nothing has arrived yet.
+def rr_sweep(arrival, burst, priority, time_quantum=5):
+    n = len(arrival)
+    remaining_time = list(burst)
+    completion = [0] * n
+    time = 0
+    while any(rt > 0 for rt in remaining_time):
+        for i in range(n):
+            if arrival[i] <= time and remaining_time[i] > 0:
+                exec_time = min(time_quantum, remaining_time[i])
+                time += exec_time
+                remaining_time[i] -= exec_time
+                if remaining_time[i] == 0:
+                    completion[i] = time
+    return completion
+
+
+# SJF non-preemptive.py: linear scan per dispatch. Spins if nothing has arrived yet.
+def sjf_scan(arrival, burst, priority):
+    n = len(arrival)
+    completion = [0] * n
+    time_unit = 0
+    completed = 0
+    while completed != n:
+        index = -1
+        min_time = float('inf')
+        for i in range(n):
+            if arrival[i] <= time_unit and completion[i] == 0 and burst[i] < min_time:
+                min_time = burst[i]
+                index = i
+        if index != -1:
+            time_unit += burst[index]
+            completion[index] = time_unit
+            completed += 1
+    return completion
+
+
+# SJF preemptive.py: one time unit per iteration with a full scan each tick
+def srtf_tick(arrival, burst, priority):
+    n = len(arrival)
+    remaining_time = list(burst)
+    completion = [0] * n
+    time = 0
+    completed = 0
+    while completed != n:
+        index = -1
+        min_time = float('inf')
+        for i in range(n):
+            if arrival[i] <= time and 0 < remaining_time[i] < min_time:
+                min_time = remaining_time[i]
+                index = i
+        if index != -1:
+            remaining_time[index] -= 1
+            if remaining_time[index] == 0:
+                completion[index] = time + 1
+                completed += 1
+        time += 1
+    return completion
+
+
+# PriorityScheduling non-preemtive.py: re-sort the remaining processes on every dispatch
+def priority_sort(arrival, burst, priority):
+    completion = [0] * len(arrival)
+    current_time = 0
+    remaining_processes = list(range(len(arrival)))
+    while remaining_processes:
+        remaining_processes.sort(key=lambda i: (priority[i], arrival[i]))
+        i = remaining_processes.pop(0)
+        current_time = max(current_time, arrival[i]) + burst[i]
+        completion[i] = current_time
+    return completion
+
+
+# PriorityScheduling Preemptive.py: one time unit per iteration, rebuilding the ready-queue
+# membership list and re-sorting it every tick. The original loop never terminated; this copy
+# stops once every process has completed.
+def priority_preemptive_tick(arrival, burst, priority):
+    n = len(arrival)
+    order = sorted(range(n), key=lambda i: (arrival[i], priority[i]))
+    remaining_burst_time = list(burst)
+    completion = [0] * n
+    ready_queue = []
+    current_time = 0
+    completed = 0
+    while completed < n:
+        for i in order:
+            if arrival[i] <= current_time and i not in [p for p in ready_queue] and remaining_burst_time[i] > 0:
+                ready_queue.append(i)
+        if not ready_queue:
+            current_time += 1
+            continue
+        ready_queue.sort(key=lambda i: (priority[i], arrival[i]))
+        i = ready_queue[0]
+        remaining_burst_time[i] -= 1
+        if remaining_burst_time[i] == 0:
+            completion[i] = current_time + 1
+            ready_queue = [p for p in ready_queue if p != i]
+            completed += 1
+        current_time += 1
+    return completion
+
+
+# Legacy baseline for each policy name
+LEGACY = {
+    "fcfs": fcfs_threads,
+    "rr": rr_sweep,
+    "sjf": sjf_scan,
+    "srtf": srtf_tick,
+    "priority": priority_sort,
+    "priority_preemptive": priority_preemptive_tick,
+}
@@ -0,0 +1,142 @@
+# Benchmark every scheduling engine across workload sizes and shapes.
+#
+#     python -m benchmarks.run --output results.json
+#     python -m benchmarks.run --compare results.json
+#
+# Each case runs in its own child process, so peak RSS is per case and a hung legacy
+# baseline can be killed at the timeout.
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import sys
+import time
+
+import numpy as np
+
+from scheduling.deadline import DEADLINE_POLICIES
+from scheduling.generators import SHAPES, with_deadlines
+from scheduling.policies import POLICIES
+
+from .legacy import LEGACY
+
+SIZES = [10 ** k for k in range(2, 8)]
+LEGACY_MAX_N = 10 ** 4  # The legacy loops are quadratic or worse; the FCFS one starts a thread per job
+SEED = 0
+
+
+def _run_case(engine, policy, shape, n, results):
+    workload = SHAPES[shape](n, seed=SEED)
+    if policy in DEADLINE_POLICIES:
+        workload = with_deadlines(workload, seed=SEED)
+    if engine == "legacy":
+        columns = (workload.arrival.tolist(), workload.burst.tolist(), workload.priority.tolist())
+        start = time.perf_counter()
+        completion = LEGACY[policy](*columns)
+        elapsed = time.perf_counter() - start
+        events = 2 * n  # Dispatches plus completions, at minimum
+    else:
+        start = time.perf_counter()
+        schedule = POLICIES[policy](workload)
+        elapsed = time.perf_counter() - start
+        completion = schedule.completion
+        events = len(schedule.segments) + n
+    results.put({
+        "wall_time": elapsed,
+        "events": events,
+        "events_per_second": events / elapsed if elapsed else None,
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "checksum": int(np.asarray(completion, dtype=np.int64).sum()),
+    })
+
+
+# Run one case in a child process; returns its measurements, or None if it timed out or failed
+def run_case(engine, policy, shape, n, timeout):
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    child = context.Process(target=_run_case, args=(engine, policy, shape, n, results))
+    child.start()
+    child.join(timeout)
+    if child.is_alive():
+        child.kill()
+        child.join()
+        return None
+    return results.get() if child.exitcode == 0 else None
+
+
+def run(policies, shapes, sizes, timeout, legacy=True):
+    results = []
+    for engine in ("scheduling", "legacy") if legacy else ("scheduling",):
+        for policy in policies:
+            # Only the original textbook policies have a legacy loop to compare with
+            if engine == "legacy" and policy not in LEGACY:
+                continue
+            for shape in shapes:
+                for n in sizes:
+                    if engine == "legacy" and n > LEGACY_MAX_N:
+                        break
+                    measurement = run_case(engine, policy, shape, n, timeout)
+                    row = {"engine": engine, "policy": policy, "shape": shape, "n": n, "timed_out": measurement is None}
+                    row.update(measurement or {})
+                    results.append(row)
+                    print_row(row)
+                    # Larger sizes will not finish either
+                    if measurement is None:
+                        break
+    return results
+
+
+# Function to print one benchmark row
+def print_row(row):
+    if row["timed_out"]:
+        timing = "timed out"
+    else:
+        timing = f"{row['wall_time']:>10.4f}s {row['events_per_second'] or 0:>14,.0f} ev/s {row['peak_rss_kb'] / 1024:>9.1f} MiB"
+    print(f"{row['engine']:<12}{row['policy']:<22}{row['shape']:<11}{row['n']:>10}  {timing}", flush=True)
+
+
+# Print wall-time ratios against an earlier results file
+def compare(current, baseline_path, threshold=1.2):
+    with open(baseline_path) as f:
+        baseline = {(r["engine"], r["policy"], r["shape"], r["n"]): r for r in json.load(f)["results"]}
+    regressions = 0
+    for row in current:
+        old = baseline.get((row["engine"], row["policy"], row["shape"], row["n"]))
+        if old is None or old["timed_out"] or row["timed_out"]:
+            continue
+        ratio = row["wall_time"] / old["wall_time"]
+        flag = "REGRESSION" if ratio > threshold else ""
+        regressions += bool(flag)
+        print(f"{row['engine']:<12}{row['policy']:<22}{row['shape']:<11}{row['n']:>10}  x{ratio:.2f} {flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark scheduling engines")
+    parser.add_argument("--policy", action="append", choices=list(POLICIES), help="policies to run (default: all)")
+    parser.add_argument("--shape", action="append", choices=list(SHAPES), help="workload shapes (default: all)")
+    parser.add_argument("--max-n", type=int, default=SIZES[-1])
+    parser.add_argument("--timeout", type=float, default=120.0, help="seconds per case")
+    parser.add_argument("--no-legacy", action="store_true", help="skip the original script loops")
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--compare", help="earlier JSON results to compare wall times against")
+    args = parser.parse_args(argv)
+
+    sizes = [n for n in SIZES if n <= args.max_n]
+    results = run(args.policy or list(POLICIES), args.shape or list(SHAPES), sizes, args.timeout, not args.no_legacy)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "platform": platform.platform(),
+                "seed": SEED,
+                "results": results,
+            }, f, indent=2)
+    if args.compare:
+        sys.exit(1 if compare(results, args.compare) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+# Importable CPU scheduling policies. Plotting and table output live in the scripts,
+# so importing this package never pulls in matplotlib or prettytable.
+from .process import Process
+from .workload import Workload, as_workload
+from .schedule import Schedule
+from .metrics import summarize
+from .fcfs import fcfs
+from .rr import rr
+from .sjf import sjf, srtf
+from .priority import priority, priority_preemptive
+from .mlfq import mlfq
+from .fair import cfs, stride, lottery
+from .deadline import edf, llf, AdmissionControl
+from .incremental import IncrementalScheduler
+from .policies import POLICIES, get_policy
+
+__all__ = [
+    "Process",
+    "Workload",
+    "as_workload",
+    "Schedule",
+    "summarize",
+    "fcfs",
+    "rr",
+    "sjf",
+    "srtf",
+    "priority",
+    "priority_preemptive",
+    "mlfq",
+    "cfs",
+    "stride",
+    "lottery",
+    "edf",
+    "llf",
+    "AdmissionControl",
+    "IncrementalScheduler",
+    "POLICIES",
+    "get_policy",
+]
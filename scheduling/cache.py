@@ -0,0 +1,163 @@
+# Memoized policy results, keyed by a content hash of the workload columns plus the policy
+# name and its parameters. Results live in an in-memory LRU in front of an on-disk store
+# that evicts the least recently used entries once it grows past max_bytes.
+import argparse
+import hashlib
+import json
+import os
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+from .metrics import summarize
+from .policies import get_policy
+from .workload import as_workload
+
+CachedResult = namedtuple("CachedResult", "completion summary")
+
+# Columns that determine a schedule, plus deadlines when present; display names do not
+FINGERPRINT_COLUMNS = ("arrival", "burst", "priority", "pid")
+
+
+def default_directory():
+    return os.environ.get("SCHEDULING_CACHE") or os.path.join(os.path.expanduser("~"), ".cache", "scheduling")
+
+
+# Content hash of the workload columns, independent of how the workload was loaded
+def fingerprint(workload):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(len(workload).to_bytes(8, "little"))
+    for attribute in FINGERPRINT_COLUMNS:
+        column = np.ascontiguousarray(getattr(workload, attribute))
+        digest.update(column.dtype.str.encode())
+        digest.update(column.data)
+    if workload.deadline is not None:
+        digest.update(b"deadline")
+        digest.update(np.ascontiguousarray(workload.deadline).data)
+    return digest.hexdigest()
+
+
+def cache_key(workload_fingerprint, policy, params):
+    spec = json.dumps([workload_fingerprint, policy, params], sort_keys=True, default=list)
+    return hashlib.blake2b(spec.encode(), digest_size=16).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, directory=None, memory_items=128, max_bytes=256 << 20):
+        self.directory = default_directory() if directory is None else directory
+        self.memory_items = memory_items
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        os.makedirs(self.directory, exist_ok=True)
+        self._disk_bytes = sum(entry.stat().st_size for entry in self._entries())
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".npz")
+
+    def _entries(self):
+        return [entry for entry in os.scandir(self.directory) if entry.name.endswith(".npz")]
+
+    def _remember(self, key, result):
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        result = self._memory.get(key)
+        if result is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return result
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                result = CachedResult(data["completion"], json.loads(str(data["summary"])))
+            os.utime(path)  # Disk eviction goes by modification time, so a hit refreshes it
+        except (FileNotFoundError, KeyError, ValueError, OSError):
+            self.misses += 1
+            return None
+        self._remember(key, result)
+        self.hits += 1
+        return result
+
+    def put(self, key, completion, summary):
+        result = CachedResult(np.asarray(completion), summary)
+        self._remember(key, result)
+        path = self._path(key)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as file:
+            np.savez(file, completion=result.completion, summary=np.array(json.dumps(summary)))
+        if os.path.exists(path):
+            self._disk_bytes -= os.path.getsize(path)
+        os.replace(temporary, path)
+        self._disk_bytes += os.path.getsize(path)
+        if self._disk_bytes > self.max_bytes:
+            self._evict()
+        return result
+
+    # Drop least recently used files until the store is back under max_bytes
+    def _evict(self):
+        entries = sorted(self._entries(), key=lambda entry: entry.stat().st_mtime)
+        self._disk_bytes = sum(entry.stat().st_size for entry in entries)
+        for entry in entries:
+            if self._disk_bytes <= self.max_bytes:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+            except FileNotFoundError:
+                continue
+            self._disk_bytes -= size
+            self._memory.pop(entry.name[:-4], None)
+
+    def clear(self):
+        self._memory.clear()
+        for entry in self._entries():
+            os.remove(entry.path)
+        self._disk_bytes = 0
+
+    def stats(self):
+        return {"directory": self.directory, "entries": len(self._entries()), "bytes": self._disk_bytes,
+                "max_bytes": self.max_bytes, "memory_entries": len(self._memory), "hits": self.hits,
+                "misses": self.misses}
+
+
+# Run a policy with a cores parameter on the multi-core engine, otherwise on its single-core one
+def compute(policy, workload, **params):
+    if "cores" in params:
+        from .multicore import multicore
+
+        schedule = multicore(workload, policy, **params)
+    else:
+        schedule = get_policy(policy)(workload, **params)
+    return schedule.completion, summarize(schedule)
+
+
+# Completion times and summary of a policy run, computed only if the cache does not have them
+def cached_run(policy, processes, cache=None, **params):
+    workload = as_workload(processes)
+    cache = ResultCache() if cache is None else cache
+    key = cache_key(fingerprint(workload), policy, params)
+    result = cache.get(key)
+    if result is None:
+        result = cache.put(key, *compute(policy, workload, **params))
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect or clear the policy result cache")
+    parser.add_argument("command", choices=("stats", "clear"))
+    parser.add_argument("--directory", default=None, help="cache directory (default: $SCHEDULING_CACHE or ~/.cache/scheduling)")
+    args = parser.parse_args(argv)
+
+    cache = ResultCache(args.directory)
+    if args.command == "clear":
+        cache.clear()
+    print(json.dumps(cache.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+import random
+
+import numpy as np
+
+from .runqueue import RunQueue
+from .schedule import Schedule, add_segment
+from .workload import as_workload
+
+# Policies that need a deadline column
+DEADLINE_POLICIES = ("edf", "llf")
+
+
+def _deadline_workload(processes):
+    workload = as_workload(processes)
+    if workload.deadline is None:
+        raise ValueError("deadline policies need a workload with a deadline column")
+    return workload
+
+
+# Preemptive Earliest Deadline First: the arrived process with the earliest deadline runs (then
+# earliest arrival, then input order), until it completes or the next arrival may preempt it
+def edf(processes):
+    workload = _deadline_workload(processes)
+    n = len(workload)
+    arrival = workload.arrival.tolist()
+    deadline = workload.deadline.tolist()
+    remaining_time = workload.burst.tolist()
+    completion = [0] * n
+    segments = []
+    arrival_order = np.argsort(workload.arrival, kind="stable").tolist()
+    run_queue = RunQueue()
+    next_arrival = 0
+    time = 0
+    completed = 0
+
+    while completed < n:
+        # Admit every process that has arrived by now
+        while next_arrival < n and arrival[arrival_order[next_arrival]] <= time:
+            i = arrival_order[next_arrival]
+            run_queue.push(i, (deadline[i], arrival[i], i))
+            next_arrival += 1
+
+        # CPU is idle, jump straight to the next arrival
+        if not run_queue:
+            time = arrival[arrival_order[next_arrival]]
+            continue
+
+        _, i = run_queue.peek()
+        run_until = time + remaining_time[i]
+        if next_arrival < n:
+            run_until = min(run_until, arrival[arrival_order[next_arrival]])
+
+        add_segment(segments, i, time, run_until)
+        remaining_time[i] -= run_until - time
+        time = run_until
+        if remaining_time[i] == 0:
+            completion[i] = time
+            run_queue.remove(i)
+            completed += 1
+
+    return Schedule("edf", workload, completion, segments)
+
+
+# Preemptive Least Laxity First: the process with the least laxity (deadline - now - remaining)
+# runs. Waiting processes all lose laxity at the same rate, so they are ordered by the static key
+# deadline - remaining; the running process keeps its laxity, so it is switched out as soon as
+# its key passes the best waiting one. Ties keep the running process, which limits thrashing
+# between equal laxities to one switch per time unit.
+def llf(processes):
+    workload = _deadline_workload(processes)
+    n = len(workload)
+    arrival = workload.arrival.tolist()
+    deadline = workload.deadline.tolist()
+    remaining_time = workload.burst.tolist()
+    completion = [0] * n
+    segments = []
+    arrival_order = np.argsort(workload.arrival, kind="stable").tolist()
+    run_queue = RunQueue()  # Waiting processes by (deadline - remaining, process index)
+    next_arrival = 0
+    running = -1
+    time = 0
+    completed = 0
+
+    while completed < n:
+        while next_arrival < n and arrival[arrival_order[next_arrival]] <= time:
+            i = arrival_order[next_arrival]
+            run_queue.push(i, (deadline[i] - remaining_time[i], i))
+            next_arrival += 1
+
+        if running < 0:
+            # CPU is idle, jump straight to the next arrival
+            if not run_queue:
+                time = arrival[arrival_order[next_arrival]]
+                continue
+            running = run_queue.pop()
+        else:
+            # Switch if a waiting process now has strictly less laxity
+            top = run_queue.peek()
+            if top is not None and top[0][0] < deadline[running] - remaining_time[running]:
+                run_queue.push(running, (deadline[running] - remaining_time[running], running))
+                running = run_queue.pop()
+
+        i = running
+        run_until = time + remaining_time[i]
+        if next_arrival < n:
+            run_until = min(run_until, arrival[arrival_order[next_arrival]])
+        top = run_queue.peek()
+        if top is not None:
+            # Run until this process's key passes the best waiting one
+            run_until = min(run_until, time + top[0][0] - (deadline[i] - remaining_time[i]) + 1)
+
+        add_segment(segments, i, time, run_until)
+        remaining_time[i] -= run_until - time
+        time = run_until
+        if remaining_time[i] == 0:
+            completion[i] = time
+            running = -1
+            completed += 1
+
+    return Schedule("llf", workload, completion, segments)
+
+
+# Treap node for admission control: jobs ordered by (deadline, admission order), each subtree
+# tracking its total remaining work and minimum slack, with a pending slack change for children
+class _Node:
+    __slots__ = ("key", "weight", "work", "slack", "total", "min_slack", "lazy", "left", "right", "job")
+
+    def __init__(self, key, weight, work, slack, job):
+        self.key = key
+        self.weight = weight
+        self.work = work
+        self.slack = slack
+        self.total = work
+        self.min_slack = slack
+        self.lazy = 0
+        self.left = None
+        self.right = None
+        self.job = job
+
+
+def _shift(node, delta):
+    if node is not None:
+        node.slack += delta
+        node.min_slack += delta
+        node.lazy += delta
+
+
+def _push(node):
+    if node.lazy:
+        _shift(node.left, node.lazy)
+        _shift(node.right, node.lazy)
+        node.lazy = 0
+
+
+def _pull(node):
+    node.total = node.work
+    node.min_slack = node.slack
+    for child in (node.left, node.right):
+        if child is not None:
+            node.total += child.total
+            node.min_slack = min(node.min_slack, child.min_slack)
+
+
+# Split into keys below `key` and the rest
+def _split(node, key):
+    if node is None:
+        return None, None
+    _push(node)
+    if node.key < key:
+        node.right, right = _split(node.right, key)
+        _pull(node)
+        return node, right
+    left, node.left = _split(node.left, key)
+    _pull(node)
+    return left, node
+
+
+def _merge(left, right):
+    if left is None or right is None:
+        return left or right
+    if left.weight > right.weight:
+        _push(left)
+        left.right = _merge(left.right, right)
+        _pull(left)
+        return left
+    _push(right)
+    right.left = _merge(left, right.left)
+    _pull(right)
+    return right
+
+
+# Incremental admission control for preemptive EDF on one CPU. Admitted jobs are kept in a treap
+# ordered by deadline; each job's slack is deadline - now - (work due by its deadline), and the
+# backlog meets every deadline exactly when the minimum slack is non-negative. While the CPU
+# works through the backlog in EDF order the clock and the work due advance together, so slacks
+# only change when a job is admitted: the new job's slack comes from the work due before it, and
+# every later deadline loses its burst. A query or admission costs O(log n) expected and each
+# completed job O(log n) to retire, instead of re-simulating the backlog.
+#
+#     control = AdmissionControl()
+#     job = control.admit(burst=5, deadline=20)   # job id, or None if it would cause a miss
+#     control.advance_to(10)                      # run the backlog; returns (job, completion) pairs
+class AdmissionControl:
+    def __init__(self, seed=0):
+        self.clock = 0
+        self._root = None
+        self._jobs = 0
+        self._rng = random.Random(seed)
+
+    # Work due before a (deadline, order) key, and the minimum slack before and at or after it
+    def _probe(self, key):
+        node = self._root
+        pending = 0  # Slack changes of ancestors not yet pushed to this node's children
+        before = 0
+        min_before = min_after = float("inf")
+        while node is not None:
+            if node.key < key:
+                before += node.work + (node.left.total if node.left is not None else 0)
+                min_before = min(min_before, node.slack + pending)
+                if node.left is not None:
+                    min_before = min(min_before, node.left.min_slack + pending + node.lazy)
+                pending += node.lazy
+                node = node.right
+            else:
+                min_after = min(min_after, node.slack + pending)
+                if node.right is not None:
+                    min_after = min(min_after, node.right.min_slack + pending + node.lazy)
+                pending += node.lazy
+                node = node.left
+        return before, min_before, min_after
+
+    # Whether a job released now could be admitted with every admitted job meeting its deadline
+    def can_admit(self, burst, deadline):
+        before, min_before, min_after = self._probe((deadline, self._jobs))
+        return deadline - self.clock - before - burst >= 0 and min_before >= 0 and min_after >= burst
+
+    # Admit a job released now; returns its id, or None if it was refused (force admits anyway)
+    def admit(self, burst, deadline, force=False):
+        if burst <= 0:
+            raise ValueError("burst must be positive")
+        key = (deadline, self._jobs)
+        before, min_before, min_after = self._probe(key)
+        slack = deadline - self.clock - before - burst
+        if not force and (slack < 0 or min_before < 0 or min_after < burst):
+            return None
+        left, right = _split(self._root, key)
+        _shift(right, -burst)
+        self._root = _merge(_merge(left, _Node(key, self._rng.random(), burst, slack, self._jobs)), right)
+        self._jobs += 1
+        return self._jobs - 1
+
+    # Run the earliest-deadline job for up to `run` time units; returns the new subtree root
+    def _run_first(self, node, run, completions):
+        _push(node)
+        if node.left is not None:
+            node.left = self._run_first(node.left, run, completions)
+            _pull(node)
+            return node
+        node.work -= run
+        if node.work == 0:
+            completions.append((node.job, self.clock))
+            return node.right
+        _pull(node)
+        return node
+
+    # Work through the backlog in EDF order up to time t; returns (job id, completion) pairs
+    def advance_to(self, t):
+        if t < self.clock:
+            raise ValueError(f"cannot move the clock back from {self.clock} to {t}")
+        completions = []
+        while self._root is not None and self.clock < t:
+            first = self._root
+            while first.left is not None:
+                first = first.left
+            run = min(first.work, t - self.clock)
+            self.clock += run
+            self._root = self._run_first(self._root, run, completions)
+        self.clock = t
+        return completions
+
+    # Smallest slack in the backlog; negative means a forced admission will miss
+    @property
+    def min_slack(self):
+        return self._root.min_slack if self._root is not None else None
+
+    @property
+    def backlog(self):
+        return self._root.total if self._root is not None else 0
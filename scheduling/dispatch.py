@@ -0,0 +1,52 @@
+import numpy as np
+
+from .runqueue import heap_ops
+from .schedule import Schedule
+
+
+# Shared non-preemptive dispatcher. Whenever the CPU frees up, the arrived process with the
+# smallest key runs to completion. key_columns are arrays ordered from most to least significant,
+# with the input position as the final tie-break. Keys are folded into a single rank up front, so
+# the ready heap holds plain ints and each dispatch costs O(log n). counters, if given, receives
+# the ready queue operation counts.
+def run_nonpreemptive(policy, workload, *key_columns, counters=None):
+    n = len(workload)
+    arrival = workload.arrival.tolist()
+    burst = workload.burst.tolist()
+    by_key = np.lexsort((np.arange(n),) + tuple(reversed(key_columns))).tolist()
+    rank = [0] * n
+    for position, i in enumerate(by_key):
+        rank[i] = position
+    arrival_order = np.argsort(workload.arrival, kind="stable").tolist()
+
+    completion = [0] * n
+    dispatched = []
+    starts = []
+    ready_queue = []  # Min-heap of key ranks
+    push, pop = heap_ops(counters)
+    next_arrival = 0
+    current_time = 0
+
+    while len(dispatched) < n:
+        # CPU is idle, jump straight to the next arrival
+        if not ready_queue:
+            current_time = max(current_time, arrival[arrival_order[next_arrival]])
+
+        # Admit every process that has arrived by now
+        while next_arrival < n and arrival[arrival_order[next_arrival]] <= current_time:
+            push(ready_queue, rank[arrival_order[next_arrival]])
+            next_arrival += 1
+
+        # Execute the process with the smallest key completely
+        i = by_key[pop(ready_queue)]
+        dispatched.append(i)
+        starts.append(current_time)
+        current_time += burst[i]
+        completion[i] = current_time
+
+    segments = np.column_stack((
+        np.array(dispatched, dtype=np.int64),
+        np.array(starts, dtype=np.int64),
+        np.array(starts, dtype=np.int64) + workload.burst[dispatched],
+    ))
+    return Schedule(policy, workload, completion, segments)
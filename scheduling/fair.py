@@ -0,0 +1,190 @@
+import random
+
+import numpy as np
+
+from .runqueue import RunQueue, TicketTree
+from .schedule import Schedule, add_segment
+from .workload import as_workload
+
+# Linux load weight of each nice level from -20 to 19; nice 0 weighs 1024 and each level is ~1.25x
+NICE_TO_WEIGHT = (
+    88761, 71755, 56483, 46273, 36291, 29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906, 3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423, 335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45, 36, 29, 23, 18, 15,
+)
+# Virtual time per unit of real time at weight 1, large enough that integer division stays precise
+VIRTUAL_SCALE = 1024 << 10
+
+
+# Share weight of each process, treating priority as a nice level (lower value is higher priority)
+def weights(workload):
+    return [NICE_TO_WEIGHT[min(max(p, -20), 19) + 20] for p in workload.priority.tolist()]
+
+
+# Completely Fair Scheduling: run the process with the smallest weighted virtual runtime.
+# Every target_latency time units each runnable process gets a slice proportional to its weight;
+# once that would leave slices under min_granularity the period stretches to
+# runnable * min_granularity instead. A new process starts at the queue's minimum virtual runtime,
+# so it neither starves the others nor is starved for time it was not runnable. Processes arriving
+# during a slice are admitted when it ends.
+def cfs(processes, target_latency=20, min_granularity=4):
+    if target_latency <= 0 or min_granularity <= 0:
+        raise ValueError("target_latency and min_granularity must be positive")
+
+    workload = as_workload(processes)
+    n = len(workload)
+    arrival = workload.arrival.tolist()
+    remaining_time = workload.burst.tolist()
+    weight = weights(workload)
+    vruntime = [0] * n
+    completion = [0] * n
+    segments = []
+    arrival_order = np.argsort(workload.arrival, kind="stable").tolist()
+    run_queue = RunQueue()  # Keyed by (virtual runtime, process index)
+    next_arrival = 0
+    min_vruntime = 0  # Never moves back
+    total_weight = 0
+    time = 0
+    completed = 0
+
+    def admit():
+        nonlocal next_arrival, total_weight
+        while next_arrival < n and arrival[arrival_order[next_arrival]] <= time:
+            i = arrival_order[next_arrival]
+            vruntime[i] = min_vruntime
+            run_queue.push(i, (min_vruntime, i))
+            total_weight += weight[i]
+            next_arrival += 1
+
+    while completed < n:
+        # CPU is idle, jump straight to the next arrival
+        if not run_queue:
+            time = max(time, arrival[arrival_order[next_arrival]])
+        admit()
+
+        runnable = len(run_queue)
+        i = run_queue.pop()
+        period = max(target_latency, runnable * min_granularity)
+        run = min(remaining_time[i], max(1, period * weight[i] // total_weight))
+        add_segment(segments, i, time, time + run)
+        time += run
+        remaining_time[i] -= run
+        vruntime[i] += run * VIRTUAL_SCALE // weight[i]
+
+        if remaining_time[i] == 0:
+            completion[i] = time
+            total_weight -= weight[i]
+            completed += 1
+        else:
+            run_queue.push(i, (vruntime[i], i))
+        top = run_queue.peek()
+        if top is not None:
+            min_vruntime = max(min_vruntime, top[0][0])
+        admit()
+
+    return Schedule("cfs", workload, completion, segments)
+
+
+# Stride scheduling: deterministic proportional share. Each process holds tickets equal to its
+# weight and advances its pass value by stride = VIRTUAL_SCALE / tickets per unit of CPU; the
+# process with the lowest pass runs next for up to time_quantum. Newcomers join at the global pass.
+def stride(processes, time_quantum=5):
+    if time_quantum <= 0:
+        raise ValueError("time_quantum must be positive")
+
+    workload = as_workload(processes)
+    n = len(workload)
+    arrival = workload.arrival.tolist()
+    remaining_time = workload.burst.tolist()
+    step = [VIRTUAL_SCALE // w for w in weights(workload)]
+    pass_value = [0] * n
+    completion = [0] * n
+    segments = []
+    arrival_order = np.argsort(workload.arrival, kind="stable").tolist()
+    run_queue = RunQueue()  # Keyed by (pass, process index)
+    next_arrival = 0
+    global_pass = 0
+    time = 0
+    completed = 0
+
+    def admit():
+        nonlocal next_arrival
+        while next_arrival < n and arrival[arrival_order[next_arrival]] <= time:
+            i = arrival_order[next_arrival]
+            pass_value[i] = global_pass
+            run_queue.push(i, (global_pass, i))
+            next_arrival += 1
+
+    while completed < n:
+        # CPU is idle, jump straight to the next arrival
+        if not run_queue:
+            time = max(time, arrival[arrival_order[next_arrival]])
+        admit()
+
+        i = run_queue.pop()
+        run = min(remaining_time[i], time_quantum)
+        add_segment(segments, i, time, time + run)
+        time += run
+        remaining_time[i] -= run
+        pass_value[i] += step[i] * run
+
+        if remaining_time[i] == 0:
+            completion[i] = time
+            completed += 1
+        else:
+            run_queue.push(i, (pass_value[i], i))
+        top = run_queue.peek()
+        if top is not None:
+            global_pass = max(global_pass, top[0][0])
+        admit()
+
+    return Schedule("stride", workload, completion, segments)
+
+
+# Lottery scheduling: randomized proportional share. Every time_quantum a ticket is drawn among
+# the runnable processes (tickets equal to weight) and its holder runs; reproducible for a seed.
+def lottery(processes, time_quantum=5, seed=0):
+    if time_quantum <= 0:
+        raise ValueError("time_quantum must be positive")
+
+    workload = as_workload(processes)
+    n = len(workload)
+    arrival = workload.arrival.tolist()
+    remaining_time = workload.burst.tolist()
+    weight = weights(workload)
+    completion = [0] * n
+    segments = []
+    arrival_order = np.argsort(workload.arrival, kind="stable").tolist()
+    tickets = TicketTree(n)
+    rng = random.Random(seed)
+    next_arrival = 0
+    time = 0
+    completed = 0
+
+    def admit():
+        nonlocal next_arrival
+        while next_arrival < n and arrival[arrival_order[next_arrival]] <= time:
+            i = arrival_order[next_arrival]
+            tickets.set(i, weight[i])
+            next_arrival += 1
+
+    while completed < n:
+        # CPU is idle, jump straight to the next arrival
+        if not tickets.total:
+            time = max(time, arrival[arrival_order[next_arrival]])
+        admit()
+
+        i = tickets.find(rng.randrange(tickets.total))
+        run = min(remaining_time[i], time_quantum)
+        add_segment(segments, i, time, time + run)
+        time += run
+        remaining_time[i] -= run
+
+        if remaining_time[i] == 0:
+            completion[i] = time
+            tickets.set(i, 0)
+            completed += 1
+        admit()
+
+    return Schedule("lottery", workload, completion, segments)
@@ -0,0 +1,25 @@
+import numpy as np
+
+from .schedule import Schedule
+from .workload import as_workload
+
+
+# First-Come-First-Served: run processes to completion in order of arrival.
+# After a stable sort by arrival, completion is the prefix scan c[i] = max(c[i-1], a[i]) + b[i].
+# With S the running sum of bursts this unrolls to c[i] = S[i] + max over j <= i of (a[j] - S[j-1]),
+# which NumPy evaluates with cumsum and maximum.accumulate (arrivals are never negative, so the
+# clock starting at 0 needs no extra term).
+def fcfs(processes):
+    workload = as_workload(processes)
+    order = np.argsort(workload.arrival, kind="stable")  # Stable sort keeps input order for ties
+    arrival = workload.arrival[order]
+    burst = workload.burst[order]
+
+    total_burst = np.cumsum(burst)
+    finish = total_burst + np.maximum.accumulate(arrival - (total_burst - burst))
+    start = finish - burst
+
+    completion = np.empty_like(finish)
+    completion[order] = finish
+    segments = np.column_stack((order, start, finish))  # Exactly one segment per process
+    return Schedule("fcfs", workload, completion, segments)
@@ -0,0 +1,57 @@
+import numpy as np
+
+from .workload import Workload
+
+
+# Poisson arrivals at the given CPU load with exponentially distributed bursts
+def poisson(n, seed=0, mean_burst=10, load=0.9):
+    rng = np.random.default_rng(seed)
+    arrival = np.floor(np.cumsum(rng.exponential(mean_burst / load, n))).astype(np.int64)
+    burst = np.maximum(1, np.rint(rng.exponential(mean_burst, n))).astype(np.int64)
+    return Workload(arrival, burst, rng.integers(0, 10, n))
+
+
+# Poisson arrivals with heavy-tailed Pareto bursts of the same mean
+def pareto(n, seed=0, mean_burst=10, load=0.9, alpha=1.5):
+    rng = np.random.default_rng(seed)
+    arrival = np.floor(np.cumsum(rng.exponential(mean_burst / load, n))).astype(np.int64)
+    scale = mean_burst * (alpha - 1) / alpha
+    burst = np.maximum(1, np.rint((rng.pareto(alpha, n) + 1) * scale)).astype(np.int64)
+    return Workload(arrival, burst, rng.integers(0, 10, n))
+
+
+# Arrival storms: groups of storm_size jobs land within a short window, spaced to keep the load
+def bursty(n, seed=0, mean_burst=10, load=0.9, storm_size=100):
+    rng = np.random.default_rng(seed)
+    storms = -(-n // storm_size)
+    storm_start = np.floor(np.cumsum(rng.exponential(storm_size * mean_burst / load, storms))).astype(np.int64)
+    arrival = np.repeat(storm_start, storm_size)[:n] + rng.integers(0, mean_burst, n)
+    arrival.sort()
+    burst = np.maximum(1, np.rint(rng.exponential(mean_burst, n))).astype(np.int64)
+    return Workload(arrival, burst, rng.integers(0, 10, n))
+
+
+# Busy clusters of cluster_size jobs separated by idle gaps much longer than a cluster
+def idle_gaps(n, seed=0, mean_burst=10, load=0.9, cluster_size=50, gap=100):
+    rng = np.random.default_rng(seed)
+    arrival = np.cumsum(rng.exponential(mean_burst / load, n))
+    cluster_offset = (np.arange(n) // cluster_size) * gap * mean_burst * cluster_size
+    arrival = np.floor(arrival + cluster_offset).astype(np.int64)
+    burst = np.maximum(1, np.rint(rng.exponential(mean_burst, n))).astype(np.int64)
+    return Workload(arrival, burst, rng.integers(0, 10, n))
+
+
+# Copy of a workload with deadlines of arrival + burst * U(1, stretch), so tighter stretch means more misses
+def with_deadlines(workload, seed=0, stretch=4.0):
+    rng = np.random.default_rng(seed)
+    deadline = workload.arrival + np.ceil(workload.burst * rng.uniform(1, stretch, len(workload))).astype(np.int64)
+    return Workload(workload.arrival, workload.burst, workload.priority, workload.pid, workload.names, deadline)
+
+
+# Workload shapes by name; every generator takes (n, seed=0, ...) and is reproducible for a seed
+SHAPES = {
+    "poisson": poisson,
+    "pareto": pareto,
+    "bursty": bursty,
+    "idle_gaps": idle_gaps,
+}
@@ -0,0 +1,131 @@
+import heapq
+
+from .streaming import ARRIVAL, BURST, FIRST_START, PID, REMAINING, STREAM_POLICIES, Completion
+
+
+# Stateful scheduler for workloads that keep arriving. It holds the clock, the ready queue,
+# the running process and its remaining time as a checkpoint, so each call only pays for the
+# events it simulates:
+#
+#     scheduler = IncrementalScheduler("srtf")
+#     scheduler.submit(batch)               # processes arriving at or after the clock
+#     done = scheduler.advance_to(t)        # Completion events up to t
+#     scheduler.projections()               # projected completion of every known process
+#
+# Decisions at time t are only taken once the clock moves past t, so a process submitted with
+# arrival t is still considered exactly as the batch engines would.
+class IncrementalScheduler:
+    def __init__(self, policy, time_quantum=5):
+        try:
+            self._make_queue, self._preemptive, self._quantum = STREAM_POLICIES[policy]
+        except KeyError:
+            raise ValueError(f"unknown policy {policy!r}, expected one of: {', '.join(STREAM_POLICIES)}") from None
+        if self._quantum and time_quantum <= 0:
+            raise ValueError("time_quantum must be positive")
+        self.policy = policy
+        self.time_quantum = time_quantum
+        self.clock = 0  # Everything before the clock has been simulated
+        self._time = 0  # Time of the last scheduling decision
+        self._ready = self._make_queue()
+        self._pending = []  # Min-heap of (arrival, sequence, job) not yet admitted
+        self._sequence = 0
+        self._running = None
+        self._slice_start = 0
+        self._slice_end = 0
+
+    # Add processes; none may arrive before the clock
+    def submit(self, processes):
+        for p in processes:
+            if p.arrival < self.clock:
+                raise ValueError(f"process {p.pid!r} arrives at {p.arrival}, before the clock at {self.clock}")
+            job = [self._sequence, p.pid, p.arrival, p.burst, p.priority, p.burst, None]
+            heapq.heappush(self._pending, (p.arrival, self._sequence, job))
+            self._sequence += 1
+            # A preemptive policy reconsiders the running process when this one arrives
+            if self._preemptive and self._running is not None and p.arrival < self._slice_end:
+                self._slice_end = p.arrival
+
+    def _admit(self, time):
+        while self._pending and self._pending[0][0] <= time:
+            self._ready.push(heapq.heappop(self._pending)[2])
+
+    # Simulate up to time t and return the processes that completed on the way
+    def advance_to(self, t):
+        if t < self.clock:
+            raise ValueError(f"cannot move the clock back from {self.clock} to {t}")
+        completions = []
+        while True:
+            job = self._running
+            if job is not None:
+                elapsed = self._slice_end - self._slice_start
+                # A slice ending exactly at t is only closed now if it completes the process;
+                # otherwise arrivals at t may still need to be queued ahead of it
+                if not (self._slice_end < t or (self._slice_end == t and elapsed == job[REMAINING])):
+                    break
+                self._running = None
+                self._time = self._slice_end
+                job[REMAINING] -= elapsed
+                if elapsed and job[FIRST_START] is None:
+                    job[FIRST_START] = self._slice_start
+                self._admit(self._time)
+                if job[REMAINING] == 0:
+                    completions.append(Completion(job[PID], job[ARRIVAL], job[BURST], job[FIRST_START], self._time))
+                else:
+                    self._ready.push(job)
+                continue
+
+            if self._time >= t:
+                break
+            self._admit(self._time)
+            if not self._ready:
+                if not self._pending:
+                    break
+                # CPU is idle, jump straight to the next arrival, but never past t
+                self._time = min(self._pending[0][0], t)
+                continue
+
+            job = self._ready.pop()
+            run = job[REMAINING]
+            if self._quantum:
+                run = min(run, self.time_quantum)
+            if self._preemptive and self._pending:
+                run = min(run, self._pending[0][0] - self._time)
+            self._running = job
+            self._slice_start = self._time
+            self._slice_end = self._time + run
+
+        self.clock = t
+        self._time = max(self._time, t) if self._running is None else self._time
+        return completions
+
+    # Projected completion time of every process still in the system, assuming nothing else is
+    # submitted. Costs O(k log k) in the k processes still active, not in the history.
+    def projections(self):
+        fork = self.fork()
+        return {event.pid: event.completion for event in fork.advance_to(float("inf"))}
+
+    # Number of processes submitted but not yet completed
+    def __len__(self):
+        return len(self._ready) + len(self._pending) + (self._running is not None)
+
+    # Copy this scheduler's state into another one. Every job lives in exactly one of the pending
+    # heap, the ready queue and the running slot, so each is copied once, in O(k) for the k
+    # processes still active; everything else is immutable and shared.
+    def _copy_into(self, other):
+        other.__dict__.update(self.__dict__)
+        other._ready = self._ready.copy()
+        other._pending = [(arrival, sequence, job.copy()) for arrival, sequence, job in self._pending]
+        other._running = self._running.copy() if self._running is not None else None
+
+    # Copy of the engine state that restore() can return to any number of times
+    def snapshot(self):
+        return self.fork()
+
+    def restore(self, snapshot):
+        snapshot._copy_into(self)
+
+    # Independent scheduler starting from this one's state, for what-if branches
+    def fork(self):
+        clone = object.__new__(type(self))
+        self._copy_into(clone)
+        return clone
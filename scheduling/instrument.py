@@ -0,0 +1,204 @@
+# Run instrumentation. Schedule counters are derived exactly from a finished Schedule (every
+# segment is one dispatch, extra segments of a process are preemptions, gaps are idle time). Ready
+# queue operations happen only inside the engines' loops, so the looping engines take a counters
+# dict and count pushes and pops as they go; without one they bind heapq or the deque directly and
+# a run costs nothing extra. profile_run() passes the dict and adds per-phase wall-clock timers and
+# optional cProfile or tracemalloc capture.
+#
+# On several cores the counters are per core and summed: a context switch is a change of process
+# on one core, an idle period is a stretch of one core with nothing to run (a core that never
+# runs counts one for the whole run), and a process moving to another core counts as a
+# preemption. The queue high-water mark counts every process waiting for a CPU, across the
+# global queue or all per-core queues together. Queue operations are only counted on one CPU.
+import io
+import json
+import time
+
+import numpy as np
+
+from .metrics import summarize
+from .policies import get_policy
+from .workload import as_workload
+
+COUNTERS = (
+    ("dispatches", "Processes put on a CPU"),
+    ("context_switches", "Switches from one process to another on a CPU"),
+    ("preemptions", "Dispatches that did not run a process to completion"),
+    ("idle_periods", "Stretches of time with a CPU idle"),
+    ("idle_time", "Total CPU time spent idle"),
+    ("queue_high_water", "Largest number of processes waiting for a CPU"),
+    ("queue_pushes", "Processes put on the ready queue"),
+    ("queue_pops", "Processes taken off the ready queue"),
+)
+
+# Engines whose loops count ready queue operations; FCFS is a prefix scan with no queue
+QUEUE_COUNTED = ("rr", "sjf", "srtf", "priority", "priority_preemptive")
+
+
+class RunStats:
+    __slots__ = ("policy", "processes", "counters", "timers", "peak_memory", "profile")
+
+    def __init__(self, policy, processes, counters):
+        self.policy = policy
+        self.processes = processes
+        self.counters = counters
+        self.timers = {}  # Phase name -> seconds
+        self.peak_memory = None  # Bytes, in tracemalloc mode
+        self.profile = None  # pstats report, in cprofile mode
+
+    def to_dict(self):
+        data = {"policy": self.policy, "processes": self.processes, **self.counters,
+                "timers": dict(self.timers)}
+        if self.peak_memory is not None:
+            data["peak_memory"] = self.peak_memory
+        return data
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.to_dict(), **kwargs)
+
+    # Prometheus text exposition format
+    def to_prometheus(self, prefix="scheduler"):
+        label = f'{{policy="{self.policy}"}}'
+        lines = []
+        for name, help_text in COUNTERS:
+            if name not in self.counters:
+                continue
+            kind = "gauge" if name == "queue_high_water" else "counter"
+            metric = f"{prefix}_{name}" if kind == "gauge" else f"{prefix}_{name}_total"
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} {kind}", f"{metric}{label} {self.counters[name]}"]
+        if self.timers:
+            metric = f"{prefix}_phase_seconds"
+            lines += [f"# HELP {metric} Wall-clock time per run phase", f"# TYPE {metric} gauge"]
+            lines += [f'{metric}{{policy="{self.policy}",phase="{phase}"}} {seconds:.9f}'
+                      for phase, seconds in self.timers.items()]
+        if self.peak_memory is not None:
+            lines += [f"# TYPE {prefix}_peak_memory_bytes gauge", f"{prefix}_peak_memory_bytes{label} {self.peak_memory}"]
+        return "\n".join(lines) + "\n"
+
+
+# Derive the run counters of a finished schedule
+def collect(schedule):
+    workload = schedule.workload
+    n = len(workload)
+    segments = np.asarray(schedule.segments, dtype=np.int64).reshape(-1, 3)
+    cores = np.asarray(getattr(schedule, "segment_cores", np.zeros(len(segments), dtype=np.int64)))
+    core_count = getattr(schedule, "cores", 1)
+
+    # Segments are coalesced per core, so each one is a dispatch and each extra one a preemption
+    order = np.lexsort((segments[:, 1], cores))
+    segments, cores = segments[order], cores[order]
+    same_core = cores[1:] == cores[:-1]
+    switches = int((same_core & (segments[1:, 0] != segments[:-1, 0])).sum())
+    makespan = int(segments[:, 2].max()) if len(segments) else 0
+    busy = int((segments[:, 2] - segments[:, 1]).sum())
+    preemptions = len(segments) - n
+
+    # Idle periods: gaps between segments on a core, before a core's first segment and after its
+    # last one, and whole runs of cores that never ran anything
+    gaps = np.where(same_core, segments[1:, 1] - segments[:-1, 2], 0)
+    first = np.ones(len(segments), dtype=bool)
+    first[1:] = ~same_core
+    last = np.ones(len(segments), dtype=bool)
+    last[:-1] = ~same_core
+    unused_cores = core_count - len(np.unique(cores)) if makespan else 0
+    idle_periods = int((gaps > 0).sum() + (segments[first, 1] > 0).sum() + (segments[last, 2] < makespan).sum())
+    idle_periods += unused_cores
+
+    # Processes waiting for a CPU over time: in the system (arrived, not completed) and not in a
+    # running segment. Every change happens at an arrival, completion or segment boundary, and
+    # all changes at one instant are applied before the count is read.
+    times = np.concatenate((workload.arrival, schedule.completion, segments[:, 1], segments[:, 2]))
+    steps = np.concatenate((np.ones(n, dtype=np.int64), np.full(n, -1), np.full(len(segments), -1),
+                            np.ones(len(segments), dtype=np.int64)))
+    order = np.argsort(times, kind="stable")
+    waiting = np.cumsum(steps[order])
+    last_at_time = np.ones(len(times), dtype=bool)
+    last_at_time[:-1] = times[order][1:] != times[order][:-1]
+    queue_high_water = int(waiting[last_at_time].max()) if len(times) else 0
+
+    return RunStats(schedule.policy, n, {
+        "dispatches": len(segments),
+        "context_switches": switches,
+        "preemptions": preemptions,
+        "idle_periods": idle_periods,
+        "idle_time": core_count * makespan - busy,
+        "queue_high_water": queue_high_water,
+    })
+
+
+# Run a policy with per-phase timers: prepare (columnar conversion), simulate, metrics and
+# instrument. Engines in QUEUE_COUNTED also report their queue operations from the loop, which
+# the simulate timer includes. mode="cprofile" attaches a pstats report of the simulate phase, and
+# mode="tracemalloc" records its peak traced memory.
+def profile_run(policy, processes, mode=None, **params):
+    if mode not in (None, "cprofile", "tracemalloc"):
+        raise ValueError(f"unknown profiling mode {mode!r}")
+    engine = get_policy(policy)
+    timers = {}
+    queue_counters = {} if policy in QUEUE_COUNTED else None
+    if queue_counters is not None:
+        params = dict(params, counters=queue_counters)
+
+    start = time.perf_counter()
+    workload = as_workload(processes)
+    timers["prepare"] = time.perf_counter() - start
+
+    profiler = None
+    if mode == "cprofile":
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+    elif mode == "tracemalloc":
+        import tracemalloc
+
+        tracemalloc.start()
+    start = time.perf_counter()
+    schedule = engine(workload, **params)
+    timers["simulate"] = time.perf_counter() - start
+    peak_memory = None
+    if profiler is not None:
+        profiler.disable()
+    elif mode == "tracemalloc":
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    start = time.perf_counter()
+    summarize(schedule)
+    timers["metrics"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    stats = collect(schedule)
+    stats.counters.update(queue_counters or {})
+    timers["instrument"] = time.perf_counter() - start
+    stats.timers = timers
+    stats.peak_memory = peak_memory
+    if profiler is not None:
+        import pstats
+
+        report = io.StringIO()
+        pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(20)
+        stats.profile = report.getvalue()
+    return schedule, stats
+
+
+def main(argv=None):
+    import argparse
+
+    from . import traces
+
+    parser = argparse.ArgumentParser(description="Run a policy and report its instrumentation counters")
+    parser.add_argument("workload", help="CSV or JSONL trace, or a binary workload directory")
+    parser.add_argument("--policy", default="fcfs")
+    parser.add_argument("--format", choices=("json", "prometheus"), default="json")
+    parser.add_argument("--mode", choices=("cprofile", "tracemalloc"))
+    args = parser.parse_args(argv)
+
+    _, stats = profile_run(args.policy, traces.load(args.workload, names=False), args.mode)
+    print(stats.to_json(indent=2) if args.format == "json" else stats.to_prometheus(), end="")
+    if stats.profile:
+        print(stats.profile)
+
+
+if __name__ == "__main__":
+    main()
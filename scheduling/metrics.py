@@ -0,0 +1,39 @@
+import numpy as np
+
+METRICS = ("turnaround", "waiting", "response")
+STATISTICS = ("mean", "p50", "p95", "p99", "max")
+
+
+# Aggregate turnaround, waiting and response times of a schedule in one vectorized pass. Workloads
+# with deadlines also get lateness statistics and the fraction of processes that missed.
+def summarize(schedule):
+    has_deadlines = schedule.workload.deadline is not None
+    if not len(schedule.workload):
+        summary = {metric: dict.fromkeys(STATISTICS, 0.0) for metric in METRICS}
+        if has_deadlines:
+            summary["lateness"] = dict.fromkeys(STATISTICS, 0.0)
+            summary["miss_rate"] = 0.0
+        return summary
+
+    values = np.stack([schedule.turnaround, schedule.waiting, schedule.response])
+    means = values.mean(axis=1)
+    percentiles = np.percentile(values, [50, 95, 99], axis=1)
+    maxima = values.max(axis=1)
+
+    summary = {}
+    for row, metric in enumerate(METRICS):
+        summary[metric] = {
+            "mean": float(means[row]),
+            "p50": float(percentiles[0, row]),
+            "p95": float(percentiles[1, row]),
+            "p99": float(percentiles[2, row]),
+            "max": float(maxima[row]),
+        }
+
+    if has_deadlines:
+        lateness = schedule.lateness
+        p50, p95, p99 = np.percentile(lateness, [50, 95, 99])
+        summary["lateness"] = {"mean": float(lateness.mean()), "p50": float(p50), "p95": float(p95),
+                               "p99": float(p99), "max": float(lateness.max())}
+        summary["miss_rate"] = float((lateness > 0).mean())
+    return summary
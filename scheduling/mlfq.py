@@ -0,0 +1,107 @@
+from collections import deque
+
+import numpy as np
+
+from .schedule import Schedule, add_segment
+from .workload import as_workload
+
+
+# Multilevel feedback queue: one FIFO Round-Robin queue per level, level 0 highest.
+#
+# New processes enter level 0 with that level's quantum as their allotment. A process that uses up
+# its allotment is demoted one level (the last level is plain Round-Robin). A level-0 arrival
+# preempts a process running at a lower level, which goes back to the head of its queue keeping
+# the rest of its allotment. Every boost_interval time units all waiting processes are moved to
+# level 0 in level order, which ages long-running jobs back up and prevents starvation.
+# Non-empty levels are tracked in a bitmask, so picking the next level is O(1).
+def mlfq(processes, quanta=(5, 10, 20), boost_interval=None):
+    quanta = list(quanta)
+    if not quanta or any(q <= 0 for q in quanta):
+        raise ValueError("quanta must be a non-empty sequence of positive time slices")
+    if boost_interval is not None and boost_interval <= 0:
+        raise ValueError("boost_interval must be positive")
+
+    workload = as_workload(processes)
+    n = len(workload)
+    arrival = workload.arrival.tolist()
+    remaining_time = workload.burst.tolist()
+    completion = [0] * n
+    segments = []
+    levels = len(quanta)
+    queues = [deque() for _ in range(levels)]
+    level = [0] * n
+    allotment = [0] * n
+    nonempty = 0  # Bit L is set while queues[L] holds a process
+    arrival_order = np.argsort(workload.arrival, kind="stable").tolist()
+    next_arrival = 0
+    next_boost = boost_interval or float("inf")
+    time = 0
+    completed = 0
+
+    def enqueue(i, front=False):
+        nonlocal nonempty
+        if front:
+            queues[level[i]].appendleft(i)
+        else:
+            queues[level[i]].append(i)
+        nonempty |= 1 << level[i]
+
+    def admit():
+        nonlocal next_arrival
+        while next_arrival < n and arrival[arrival_order[next_arrival]] <= time:
+            i = arrival_order[next_arrival]
+            allotment[i] = quanta[0]
+            enqueue(i)
+            next_arrival += 1
+
+    # Move every waiting process to level 0, keeping level order and queue order
+    def boost():
+        nonlocal nonempty
+        for lower in queues[1:]:
+            for i in lower:
+                level[i] = 0
+                allotment[i] = quanta[0]
+            queues[0].extend(lower)
+            lower.clear()
+        nonempty = 1 if queues[0] else 0
+
+    while completed < n:
+        # CPU is idle, jump straight to the next arrival; boosts while idle change nothing
+        if not nonempty:
+            time = max(time, arrival[arrival_order[next_arrival]])
+            if boost_interval:
+                next_boost = (time // boost_interval + 1) * boost_interval
+        admit()
+        if time >= next_boost:
+            boost()
+            while next_boost <= time:
+                next_boost += boost_interval
+
+        current = (nonempty & -nonempty).bit_length() - 1
+        i = queues[current].popleft()
+        if not queues[current]:
+            nonempty &= ~(1 << current)
+
+        # Run until the allotment is used up, the process finishes, or a boost or a
+        # higher-level arrival preempts it
+        run_until = min(time + remaining_time[i], time + allotment[i], next_boost)
+        if current > 0 and next_arrival < n:
+            run_until = min(run_until, arrival[arrival_order[next_arrival]])
+
+        add_segment(segments, i, time, run_until)
+        remaining_time[i] -= run_until - time
+        allotment[i] -= run_until - time
+        time = run_until
+        admit()
+
+        if remaining_time[i] == 0:
+            completion[i] = time
+            completed += 1
+        elif allotment[i] == 0:
+            level[i] = min(current + 1, levels - 1)
+            allotment[i] = quanta[level[i]]
+            enqueue(i)
+        else:
+            enqueue(i, front=True)
+
+    return Schedule("mlfq", workload, completion, segments)
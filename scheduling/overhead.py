@@ -0,0 +1,249 @@
+import argparse
+import heapq
+from collections import deque
+
+import numpy as np
+
+from .metrics import summarize
+from .schedule import Schedule, add_segment
+from .workload import Workload, as_workload
+
+# policy: (ready queue key of process i, preemptive on arrival or I/O return, uses time quantum).
+# Keys see the remaining time of the current CPU burst, so sjf is shortest-next-burst. Equal keys
+# go to the process that entered the ready queue first, which for first arrivals is earliest
+# arrival then input order; sjf and srtf break ties on input order alone, as their engines do.
+OVERHEAD_POLICIES = {
+    "fcfs": (lambda priority, remaining, i: (), False, False),
+    "rr": (None, False, True),
+    "sjf": (lambda priority, remaining, i: (remaining[i], i), False, False),
+    "srtf": (lambda priority, remaining, i: (remaining[i], i), True, False),
+    "priority": (lambda priority, remaining, i: (priority[i],), False, False),
+    "priority_preemptive": (lambda priority, remaining, i: (priority[i],), True, False),
+}
+
+
+class OverheadSchedule(Schedule):
+    __slots__ = ("switches", "io_time")
+
+    def __init__(self, policy, workload, completion, segments, switches, io_time):
+        super().__init__(policy, workload, completion, segments)
+        self.switches = switches  # (start, finish) of each context switch
+        self.io_time = np.asarray(io_time, dtype=np.int64)  # Total I/O time of each process
+
+    # Time spent ready but not running, including context switches into the process
+    @property
+    def waiting(self):
+        return self.completion - self.workload.arrival - self.workload.burst - self.io_time
+
+    @property
+    def makespan(self):
+        return int(self.completion.max()) if len(self.completion) else 0
+
+    @property
+    def switch_time(self):
+        return sum(finish - start for start, finish in self.switches)
+
+    # Run counters and rates; utilization counts only useful CPU work
+    def report(self):
+        makespan = self.makespan
+        cpu_time = int(self.workload.burst.sum())
+        busy = cpu_time + self.switch_time
+        return {
+            "makespan": makespan,
+            "throughput": len(self.workload) / makespan if makespan else 0.0,
+            "cpu_utilization": cpu_time / makespan if makespan else 0.0,
+            "busy_fraction": busy / makespan if makespan else 0.0,
+            "context_switches": len(self.switches),
+            "switch_time": self.switch_time,
+            "switch_overhead": self.switch_time / busy if busy else 0.0,
+        }
+
+
+# Split each burst of a workload into alternating CPU and I/O bursts: up to `cycles` CPU bursts
+# that add up to the original burst, separated by I/O bursts of exponential length
+def alternate_bursts(processes, cycles=3, io_mean=10, seed=0):
+    workload = as_workload(processes)
+    rng = np.random.default_rng(seed)
+    bursts = []
+    for burst in workload.burst.tolist():
+        pieces = min(cycles, burst)
+        cuts = np.sort(rng.choice(np.arange(1, burst), pieces - 1, replace=False)) if pieces > 1 else []
+        cpu = np.diff([0, *cuts, burst]).tolist()
+        io = np.maximum(1, np.rint(rng.exponential(io_mean, pieces - 1))).astype(np.int64).tolist()
+        sequence = [cpu[0]]
+        for io_burst, cpu_burst in zip(io, cpu[1:]):
+            sequence += [io_burst, cpu_burst]
+        bursts.append(sequence)
+    return bursts
+
+
+# Event-driven simulation of a single-CPU policy with context-switch cost and I/O.
+#
+# bursts optionally gives each process an alternating [cpu, io, cpu, ..., cpu] sequence in place
+# of its single burst; the schedule's workload then carries total CPU time as the burst. I/O runs
+# asynchronously (any number of processes can be doing I/O at once) and a process whose I/O
+# finishes re-enters the ready queue like a new arrival. Loading a process other than the one whose
+# context is on the CPU costs switch_cost time units of busy CPU with no progress; the switch is
+# not interrupted, and resuming the same process after idle time costs nothing. Under a
+# preemptive policy a process that arrived during the switch and beats the one just loaded
+# preempts it as soon as the switch ends.
+def simulate(processes, policy="rr", time_quantum=5, switch_cost=0, bursts=None):
+    try:
+        key, preemptive, quantum = OVERHEAD_POLICIES[policy]
+    except KeyError:
+        raise ValueError(f"unknown policy {policy!r}, expected one of: {', '.join(OVERHEAD_POLICIES)}") from None
+    if quantum and time_quantum <= 0:
+        raise ValueError("time_quantum must be positive")
+    if switch_cost < 0:
+        raise ValueError("switch_cost must not be negative")
+
+    workload = as_workload(processes)
+    n = len(workload)
+    if bursts is None:
+        bursts = [[burst] for burst in workload.burst.tolist()]
+    else:
+        bursts = [list(sequence) for sequence in bursts]
+        if len(bursts) != n:
+            raise ValueError("bursts must give one sequence per process")
+        if any(len(sequence) % 2 == 0 or min(sequence) <= 0 for sequence in bursts):
+            raise ValueError("each burst sequence must alternate positive CPU and I/O bursts, starting and ending with CPU")
+        workload = Workload(workload.arrival, [sum(sequence[::2]) for sequence in bursts], workload.priority,
+                            workload.pid, workload.names, workload.deadline)
+
+    arrival = workload.arrival.tolist()
+    priority = workload.priority.tolist()
+    remaining = [sequence[0] for sequence in bursts]  # Of the current CPU burst
+    phase = [0] * n  # Index into bursts[i] of the current CPU burst
+    ready_since = [0] * n  # Sequence number of the process's latest entry into the ready queue
+    io_time = [0] * n
+    completion = [0] * n
+    segments = []
+    switches = []
+    arrival_order = np.argsort(workload.arrival, kind="stable").tolist()
+    next_arrival = 0
+    io_returns = []  # Heap of (time, sequence, process)
+    ready_queue = deque() if key is None else []
+    sequence = 0
+    loaded = -1  # Process whose context is on the CPU
+    time = 0
+    completed = 0
+
+    def push(i):
+        if key is None:
+            ready_queue.append(i)
+        else:
+            heapq.heappush(ready_queue, (key(priority, remaining, i), ready_since[i], i))
+
+    # Whether the head of the ready queue would preempt process i
+    def beaten(i):
+        return ready_queue and ready_queue[0][:2] < (key(priority, remaining, i), ready_since[i])
+
+    def ready(i):
+        nonlocal sequence
+        ready_since[i] = sequence
+        sequence += 1
+        push(i)
+
+    def next_event():
+        upcoming = arrival[arrival_order[next_arrival]] if next_arrival < n else float("inf")
+        return min(upcoming, io_returns[0][0]) if io_returns else upcoming
+
+    # Queue every arrival and I/O return up to now, in time order
+    def admit():
+        nonlocal next_arrival
+        while True:
+            upcoming = arrival[arrival_order[next_arrival]] if next_arrival < n else float("inf")
+            if io_returns and io_returns[0][0] <= min(upcoming, time):
+                ready(heapq.heappop(io_returns)[2])
+            elif upcoming <= time:
+                ready(arrival_order[next_arrival])
+                next_arrival += 1
+            else:
+                return
+
+    while completed < n:
+        # CPU is idle, jump straight to the next arrival or I/O return
+        if not ready_queue:
+            time = max(time, next_event())
+        admit()
+
+        i = ready_queue.popleft() if key is None else heapq.heappop(ready_queue)[2]
+        if i != loaded:
+            loaded = i
+            if switch_cost:
+                switches.append((time, time + switch_cost))
+                time += switch_cost
+                admit()
+                # Something better arrived during the switch, so it preempts right away
+                if preemptive and beaten(i):
+                    push(i)
+                    continue
+
+        run = remaining[i]
+        if quantum:
+            run = min(run, time_quantum)
+        if preemptive:
+            run = min(run, next_event() - time)
+        add_segment(segments, i, time, time + run)
+        time += run
+        remaining[i] -= run
+        # Arrivals during the slice are queued before the preempted process
+        admit()
+
+        if remaining[i]:
+            if key is None:
+                ready(i)
+            else:
+                push(i)  # Keeps its place among equal keys
+        elif phase[i] + 1 < len(bursts[i]):
+            io = bursts[i][phase[i] + 1]
+            io_time[i] += io
+            phase[i] += 2
+            remaining[i] = bursts[i][phase[i]]
+            heapq.heappush(io_returns, (time + io, sequence, i))
+            sequence += 1
+        else:
+            completion[i] = time
+            completed += 1
+
+    return OverheadSchedule(policy, workload, completion, segments, switches, io_time)
+
+
+# Function to print summary metrics and overhead counters, one block per run
+def print_report(schedule):
+    summary = summarize(schedule)
+    print(f"{'Metric':<12}{'Mean':<12}{'P50':<12}{'P95':<12}{'P99':<12}{'Max':<12}")
+    for metric in ("turnaround", "waiting", "response"):
+        stats = summary[metric]
+        print(f"{metric:<12}" + "".join(f"{stats[s]:<12.2f}" for s in ("mean", "p50", "p95", "p99", "max")))
+    report = schedule.report()
+    print(f"\nThroughput: {report['throughput']:.4f} processes per time unit")
+    print(f"CPU utilization: {report['cpu_utilization']:.2%} (busy {report['busy_fraction']:.2%})")
+    print(f"Context switches: {report['context_switches']} costing {report['switch_time']} "
+          f"({report['switch_overhead']:.2%} of busy time)")
+
+
+def main(argv=None):
+    from . import traces
+
+    parser = argparse.ArgumentParser(description="Simulate a policy with context-switch cost and I/O bursts")
+    parser.add_argument("workload", help="CSV or JSONL trace, or a binary workload directory")
+    parser.add_argument("--policy", default="rr", choices=OVERHEAD_POLICIES)
+    parser.add_argument("--time-quantum", type=int, action="append",
+                        help="time quantum; repeat to compare several (default: 5)")
+    parser.add_argument("--switch-cost", type=int, default=0)
+    parser.add_argument("--io-cycles", type=int, default=1, help="CPU bursts per process, separated by I/O")
+    parser.add_argument("--io-mean", type=float, default=10, help="mean I/O burst length")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    workload = traces.load(args.workload, names=False)
+    bursts = alternate_bursts(workload, args.io_cycles, args.io_mean, args.seed) if args.io_cycles > 1 else None
+    for time_quantum in args.time_quantum or [5]:
+        if len(args.time_quantum or []) > 1:
+            print(f"\n== time_quantum={time_quantum} ==")
+        print_report(simulate(workload, args.policy, time_quantum, args.switch_cost, bursts))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# Partitioned replay of large traces. A work-conserving single-CPU policy starts over from a
+# clean state whenever the CPU goes idle with nothing waiting, so a trace splits at those points
+# into busy periods that can be simulated independently. The periods are found with the FCFS
+# prefix scan (every work-conserving policy has the same busy periods), grouped into chunks of
+# similar size, run on a process pool that maps the workload from shared memory, and stitched
+# back in time order. The result is identical to a sequential run.
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from . import sweep
+from .policies import get_policy
+from .schedule import Schedule
+from .workload import Workload, as_workload
+
+# Policies whose state is empty at the start of every busy period
+PARTITION_POLICIES = ("fcfs", "rr", "sjf", "srtf", "priority", "priority_preemptive", "mlfq")
+
+_worker_order = None
+_worker_completion = None
+_worker_memory = None
+
+
+# Arrival order of the workload and the positions in it where a busy period begins
+def busy_periods(workload):
+    order = np.argsort(workload.arrival, kind="stable")
+    if not len(order):
+        return order, np.zeros(0, dtype=np.int64)
+    arrival = workload.arrival[order]
+    burst = workload.burst[order]
+    total_burst = np.cumsum(burst)
+    finish = total_burst + np.maximum.accumulate(arrival - (total_burst - burst))
+    # A period starts where a process arrives no earlier than the previous period's last finish
+    starts = np.flatnonzero(np.concatenate(([True], arrival[1:] >= finish[:-1])))
+    return order, starts
+
+
+# Group consecutive busy periods into at most `chunks` runs of similar process counts
+def chunk_bounds(starts, n, chunks):
+    targets = np.arange(1, chunks) * n / chunks
+    cuts = starts[np.minimum(np.searchsorted(starts, targets), len(starts) - 1)]
+    bounds = np.unique(np.concatenate(([0], cuts, [n])))
+    return list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+
+
+# Processes of one chunk in input order, so engines break ties exactly as on the whole trace
+def _chunk(workload, order, lo, hi):
+    index = np.sort(order[lo:hi])
+    return index, Workload(workload.arrival[index], workload.burst[index], workload.priority[index], workload.pid[index])
+
+
+def _run_chunk(policy, params, workload, order, lo, hi):
+    index, chunk = _chunk(workload, order, lo, hi)
+    schedule = get_policy(policy)(chunk, **params)
+    segments = np.asarray(schedule.segments, dtype=np.int64).reshape(-1, 3)
+    segments[:, 0] = index[segments[:, 0]]
+    return index, schedule.completion, segments
+
+
+def _attach(name, n, order_name):
+    global _worker_order, _worker_completion, _worker_memory
+    sweep._attach_workload(name, n)
+    _worker_memory = shared_memory.SharedMemory(name=order_name)
+    _worker_order = np.ndarray(n, dtype=np.int64, buffer=_worker_memory.buf)
+    _worker_completion = np.ndarray(n, dtype=np.int64, buffer=_worker_memory.buf, offset=8 * n)
+
+
+# Completion times go straight into shared memory; only the segments travel back
+def _replay_task(task):
+    policy, params, lo, hi = task
+    index, completion, segments = _run_chunk(policy, params, sweep._worker_workload, _worker_order, lo, hi)
+    _worker_completion[index] = completion
+    return segments
+
+
+# Simulate a policy chunk by chunk over a process pool; chunks defaults to 4 per worker
+def replay(processes, policy, max_workers=None, chunks=None, **params):
+    if policy not in PARTITION_POLICIES:
+        raise ValueError(f"unknown policy {policy!r}, expected one of: {', '.join(PARTITION_POLICIES)}")
+    workload = as_workload(processes)
+    n = len(workload)
+    order, starts = busy_periods(workload)
+    workers = max_workers or os.cpu_count() or 1
+    bounds = chunk_bounds(starts, n, max(chunks or 4 * workers, 1)) if n else []
+
+    if len(bounds) <= 1 or workers == 1:
+        results = [_run_chunk(policy, params, workload, order, lo, hi) for lo, hi in bounds]
+        completion = np.zeros(n, dtype=np.int64)
+        for index, chunk_completion, _ in results:
+            completion[index] = chunk_completion
+        segments = [segments for _, _, segments in results]
+    else:
+        columns = sweep._share_workload(workload)
+        memory = shared_memory.SharedMemory(create=True, size=16 * n)
+        try:
+            np.ndarray(n, dtype=np.int64, buffer=memory.buf)[:] = order
+            with ProcessPoolExecutor(workers, initializer=_attach, initargs=(columns.name, n, memory.name)) as pool:
+                segments = list(pool.map(_replay_task, [(policy, params, lo, hi) for lo, hi in bounds]))
+            completion = np.ndarray(n, dtype=np.int64, buffer=memory.buf, offset=8 * n).copy()
+        finally:
+            for block in (columns, memory):
+                block.close()
+                block.unlink()
+
+    segments = np.concatenate(segments) if segments else np.zeros((0, 3), dtype=np.int64)
+    return Schedule(policy, workload, completion, segments)
+
+
+def main(argv=None):
+    from . import traces
+
+    parser = argparse.ArgumentParser(description="Replay a large trace in parallel, split at idle busy-period boundaries")
+    parser.add_argument("workload", help="CSV or JSONL trace, or a binary workload directory")
+    parser.add_argument("--policy", default="rr", choices=PARTITION_POLICIES)
+    parser.add_argument("--time-quantum", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunks", type=int, default=None, help="chunks to split the trace into (default: 4 per worker)")
+    args = parser.parse_args(argv)
+
+    workload = traces.load(args.workload, names=False)
+    params = {"time_quantum": args.time_quantum} if args.policy == "rr" else {}
+    started = time.perf_counter()
+    order, starts = busy_periods(workload)
+    print(f"{len(workload)} processes in {len(starts)} busy periods")
+    schedule = replay(workload, args.policy, args.workers, args.chunks, **params)
+    print(f"Replayed with {args.policy} in {time.perf_counter() - started:.2f}s, makespan {int(schedule.completion.max())}")
+
+
+if __name__ == "__main__":
+    main()
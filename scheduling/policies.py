@@ -0,0 +1,40 @@
+from .deadline import edf, llf
+from .fair import cfs, lottery, stride
+from .fcfs import fcfs
+from .mlfq import mlfq
+from .priority import priority, priority_preemptive
+from .rr import rr
+from .sjf import sjf, srtf
+
+# Scheduling policies by name, for runners that pick a policy from configuration
+POLICIES = {
+    "fcfs": fcfs,
+    "rr": rr,
+    "sjf": sjf,
+    "srtf": srtf,
+    "priority": priority,
+    "priority_preemptive": priority_preemptive,
+    "mlfq": mlfq,
+    "cfs": cfs,
+    "stride": stride,
+    "lottery": lottery,
+    "edf": edf,
+    "llf": llf,
+}
+
+
+def get_policy(name):
+    try:
+        return POLICIES[name]
+    except KeyError:
+        raise ValueError(f"unknown policy {name!r}, expected one of: {', '.join(POLICIES)}") from None
+
+
+# Run a policy by name, optionally recording its schedule to a binary trace file
+def run(policy, processes, trace_path=None, **params):
+    schedule = get_policy(policy)(processes, **params)
+    if trace_path is not None:
+        from .schedtrace import write_schedule
+
+        write_schedule(schedule, trace_path)
+    return schedule
@@ -0,0 +1,60 @@
+import numpy as np
+
+from .dispatch import run_nonpreemptive
+from .runqueue import heap_ops
+from .schedule import Schedule, add_segment
+from .workload import as_workload
+
+
+# Non-preemptive priority scheduling (lower value is higher priority): among arrived processes,
+# highest priority first, then earliest arrival, then input order
+def priority(processes, counters=None):
+    workload = as_workload(processes)
+    return run_nonpreemptive("priority", workload, workload.priority, workload.arrival, counters=counters)
+
+
+# Preemptive priority scheduling, event driven
+def priority_preemptive(processes, counters=None):
+    workload = as_workload(processes)
+    arrival = workload.arrival.tolist()
+    burst = workload.burst.tolist()
+    priority_of = workload.priority.tolist()
+    n = len(workload)
+    remaining_time = list(burst)
+    completion = [0] * n
+    segments = []
+    arrival_order = np.argsort(workload.arrival, kind="stable").tolist()
+    ready_queue = []  # Min-heap of (priority, arrival time, process index)
+    push, pop = heap_ops(counters)
+    next_arrival = 0
+    current_time = 0
+    completed = 0
+
+    while completed < n:
+        # Add processes to the heap which have arrived by current time
+        while next_arrival < n and arrival[arrival_order[next_arrival]] <= current_time:
+            i = arrival_order[next_arrival]
+            push(ready_queue, (priority_of[i], arrival[i], i))
+            next_arrival += 1
+
+        # If no processes are ready, jump to the next arrival
+        if not ready_queue:
+            current_time = arrival[arrival_order[next_arrival]]
+            continue
+
+        # Run the highest priority process until it completes or the next arrival may preempt it
+        i = ready_queue[0][2]
+        run_until = current_time + remaining_time[i]
+        if next_arrival < n:
+            run_until = min(run_until, arrival[arrival_order[next_arrival]])
+
+        add_segment(segments, i, current_time, run_until)
+        remaining_time[i] -= run_until - current_time
+        current_time = run_until
+
+        if remaining_time[i] == 0:
+            completion[i] = current_time
+            pop(ready_queue)
+            completed += 1
+
+    return Schedule("priority_preemptive", workload, completion, segments)
@@ -0,0 +1,14 @@
+# Process record shared by every scheduling policy
+class Process:
+    __slots__ = ("pid", "arrival", "burst", "priority", "deadline")
+
+    def __init__(self, pid, arrival, burst, priority=0, deadline=None):
+        self.pid = pid
+        self.arrival = arrival
+        self.burst = burst
+        self.priority = priority  # Lower value is higher priority
+        self.deadline = deadline  # Absolute time the process should complete by, if it has one
+
+    def __repr__(self):
+        deadline = "" if self.deadline is None else f", deadline={self.deadline}"
+        return f"Process({self.pid!r}, arrival={self.arrival}, burst={self.burst}, priority={self.priority}{deadline})"
@@ -0,0 +1,125 @@
+# Gantt chart rendering. matplotlib is imported lazily, so importing scheduling stays light.
+import numpy as np
+
+LANE_HEIGHT = 10
+BAR_HEIGHT = 8
+COLORS = ("tab:blue", "tab:orange", "tab:green", "tab:red", "tab:purple",
+          "tab:brown", "tab:pink", "tab:gray", "tab:olive", "tab:cyan")
+
+
+# Map each process to a lane: one lane per process, or contiguous index buckets when there are
+# more processes than max_lanes. Returns the lane of every process and the lane labels.
+def assign_lanes(workload, max_lanes=64):
+    n = len(workload)
+    if n <= max_lanes:
+        return np.arange(n), [workload.name(i) for i in range(n)]
+    lane = np.arange(n) * max_lanes // n
+    first = np.searchsorted(lane, np.arange(max_lanes))
+    last = np.append(first[1:], n) - 1
+    return lane, [f"{workload.name(a)}..{workload.name(b)}" for a, b in zip(first.tolist(), last.tolist())]
+
+
+# Merge segments of the same lane that are closer than resolution time units, so nothing
+# narrower than a pixel is drawn on its own. Returns (lane, start, finish) arrays sorted by lane.
+def decimate(lane, start, finish, resolution):
+    if not len(start):
+        return lane, start, finish
+    order = np.lexsort((start, lane))
+    lane, start, finish = lane[order], start[order], finish[order]
+
+    # Offset each lane far past the previous one so a running maximum never crosses lanes
+    stride = int(finish.max()) + 2 * max(resolution, 1) + 1
+    offset = lane.astype(np.int64) * stride
+    reach = np.maximum.accumulate(finish + offset)
+    new_group = np.ones(len(start), dtype=bool)
+    new_group[1:] = (start[1:] + offset[1:]) - reach[:-1] >= resolution
+    heads = np.flatnonzero(new_group)
+    return lane[heads], start[heads], np.maximum.reduceat(finish, heads)
+
+
+# Greedily keep labels at least min_gap apart, scanning in position order
+def _spaced(positions, min_gap):
+    kept = []
+    last = -np.inf
+    for position in positions:
+        if position - last >= min_gap:
+            kept.append(position)
+            last = position
+    return kept
+
+
+# Draw a schedule on a matplotlib Axes: one lane per process, one bar collection per lane,
+# segments below pixel resolution merged and overlapping edge labels dropped
+def draw_gantt(ax, schedule, title=None, width_px=None, max_lanes=64, label_px=28):
+    segments = np.asarray(schedule.segments, dtype=np.int64).reshape(-1, 3)
+    process_lane, labels = assign_lanes(schedule.workload, max_lanes)
+    lanes = len(labels)
+    end = int(segments[:, 2].max()) if len(segments) else 1
+
+    if width_px is None:
+        width_px = ax.get_window_extent().width or 1000
+    resolution = end / width_px  # Time units per pixel
+    lane, start, finish = decimate(process_lane[segments[:, 0]], segments[:, 1], segments[:, 2], resolution)
+
+    min_label_gap = label_px * resolution
+    bounds = np.searchsorted(lane, np.arange(lanes + 1))
+    for k in range(lanes):
+        lane_start = start[bounds[k]:bounds[k + 1]]
+        lane_finish = finish[bounds[k]:bounds[k + 1]]
+        if not len(lane_start):
+            continue
+        y = (lanes - 1 - k) * LANE_HEIGHT
+        ax.broken_barh(np.column_stack((lane_start, lane_finish - lane_start)), (y + 1, BAR_HEIGHT),
+                       facecolors=COLORS[k % len(COLORS)])
+
+        # Edge labels only on bars wide enough to hold them, and never on top of each other
+        wide = (lane_finish - lane_start) >= min_label_gap
+        edges = np.unique(np.concatenate((lane_start[wide], lane_finish[wide])))
+        for position in _spaced(edges.tolist(), min_label_gap):
+            ax.text(position, y + LANE_HEIGHT - 1, f'{position}', ha='center', va='bottom', fontsize=7, color='black')
+
+    ax.set_xlim(0, end + max(1, end // 50))
+    ax.set_ylim(0, lanes * LANE_HEIGHT + 2)
+    ax.set_yticks([(lanes - 1 - k) * LANE_HEIGHT + LANE_HEIGHT / 2 for k in range(lanes)])
+    ax.set_yticklabels(labels)
+    ax.set_xlabel('Time')
+    ax.set_ylabel('Processes')
+    if title:
+        ax.set_title(title)
+    return ax
+
+
+# Render a schedule's Gantt chart straight to a PNG or SVG file without pyplot or a GUI
+def render_gantt(schedule, path, title=None, width=12, dpi=100, max_lanes=64):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    lanes = min(len(schedule.workload), max_lanes)
+    fig = Figure(figsize=(width, max(2.5, 0.3 * lanes + 1.5)), dpi=dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    draw_gantt(ax, schedule, title, width_px=width * dpi, max_lanes=max_lanes)
+    fig.tight_layout()
+    fig.savefig(path)
+    return fig
+
+
+def main(argv=None):
+    import argparse
+
+    from . import traces
+    from .policies import get_policy
+
+    parser = argparse.ArgumentParser(description="Render the Gantt chart of a policy run to PNG or SVG")
+    parser.add_argument("workload", help="CSV or JSONL trace, or a binary workload directory")
+    parser.add_argument("output", help="image path; the extension picks the format")
+    parser.add_argument("--policy", default="fcfs")
+    parser.add_argument("--max-lanes", type=int, default=64)
+    args = parser.parse_args(argv)
+
+    schedule = get_policy(args.policy)(traces.load(args.workload))
+    render_gantt(schedule, args.output, f"Gantt Chart for {args.policy}", max_lanes=args.max_lanes)
+
+
+if __name__ == "__main__":
+    main()
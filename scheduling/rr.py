@@ -0,0 +1,57 @@
+from collections import deque
+
+import numpy as np
+
+from .runqueue import fifo_ops
+from .schedule import Schedule, add_segment
+from .workload import as_workload
+
+
+# Round-Robin with a FIFO ready queue: each dispatch runs the head of the queue for up to
+# time_quantum units. Processes arriving during a slice are queued ahead of the preempted one.
+def rr(processes, time_quantum=5, counters=None):
+    if time_quantum <= 0:
+        raise ValueError("time_quantum must be positive")
+
+    workload = as_workload(processes)
+    n = len(workload)
+    arrival = workload.arrival.tolist()
+    remaining_time = workload.burst.tolist()
+    completion = [0] * n
+    segments = []
+    arrival_order = np.argsort(workload.arrival, kind="stable").tolist()
+    ready_queue = deque()
+    push, pop = fifo_ops(ready_queue, counters)
+    next_arrival = 0
+    time = 0
+    completed = 0
+
+    while completed < n:
+        # CPU is idle, jump straight to the next arrival
+        if not ready_queue:
+            time = max(time, arrival[arrival_order[next_arrival]])
+
+        # Admit every process that has arrived by now
+        while next_arrival < n and arrival[arrival_order[next_arrival]] <= time:
+            push(arrival_order[next_arrival])
+            next_arrival += 1
+
+        # Execute the head of the queue for time quantum or remaining burst time, whichever is less
+        i = pop()
+        exec_time = min(time_quantum, remaining_time[i])
+        add_segment(segments, i, time, time + exec_time)
+        time += exec_time
+        remaining_time[i] -= exec_time
+
+        # Arrivals during the slice enter the queue before the preempted process
+        while next_arrival < n and arrival[arrival_order[next_arrival]] <= time:
+            push(arrival_order[next_arrival])
+            next_arrival += 1
+
+        if remaining_time[i] == 0:
+            completion[i] = time
+            completed += 1
+        else:
+            push(i)
+
+    return Schedule("rr", workload, completion, segments)
@@ -0,0 +1,110 @@
+import heapq
+
+
+# Push and pop for an engine's ready heap. With a counters dict they also count queue_pushes and
+# queue_pops into it; without one they are heapq's own functions, so an uninstrumented loop runs
+# exactly as before.
+def heap_ops(counters=None):
+    if counters is None:
+        return heapq.heappush, heapq.heappop
+    counters.setdefault("queue_pushes", 0)
+    counters.setdefault("queue_pops", 0)
+
+    def push(heap, item):
+        counters["queue_pushes"] += 1
+        heapq.heappush(heap, item)
+
+    def pop(heap):
+        counters["queue_pops"] += 1
+        return heapq.heappop(heap)
+
+    return push, pop
+
+
+# The same for a FIFO ready queue (a deque): its bound append and popleft, or counting wrappers
+def fifo_ops(queue, counters=None):
+    if counters is None:
+        return queue.append, queue.popleft
+    counters.setdefault("queue_pushes", 0)
+    counters.setdefault("queue_pops", 0)
+
+    def push(i):
+        counters["queue_pushes"] += 1
+        queue.append(i)
+
+    def pop():
+        counters["queue_pops"] += 1
+        return queue.popleft()
+
+    return push, pop
+
+
+# Ordered run queue: a binary heap of (key, process index) with lazy deletion. Pushing a process
+# that is already queued replaces its key; the old entry stays in the heap and is skipped when it
+# reaches the top. Pick, requeue and removal are O(log n) amortized.
+class RunQueue:
+    __slots__ = ("heap", "keys")
+
+    def __init__(self):
+        self.heap = []
+        self.keys = {}  # Current key of every queued process
+
+    def push(self, i, key):
+        self.keys[i] = key
+        heapq.heappush(self.heap, (key, i))
+
+    def remove(self, i):
+        del self.keys[i]
+
+    def _clean(self):
+        heap, keys = self.heap, self.keys
+        while heap and keys.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+
+    # (key, process) with the smallest key, or None when empty
+    def peek(self):
+        self._clean()
+        return self.heap[0] if self.heap else None
+
+    def pop(self):
+        self._clean()
+        key, i = heapq.heappop(self.heap)
+        del self.keys[i]
+        return i
+
+    def __contains__(self, i):
+        return i in self.keys
+
+    def __len__(self):
+        return len(self.keys)
+
+
+# Fenwick tree over per-process ticket counts, for O(log n) weighted random picks
+class TicketTree:
+    __slots__ = ("tree", "tickets", "total", "size")
+
+    def __init__(self, n):
+        self.tree = [0] * (n + 1)
+        self.tickets = [0] * n
+        self.total = 0
+        self.size = 1 << max(n, 1).bit_length()
+
+    def set(self, i, tickets):
+        delta = tickets - self.tickets[i]
+        self.tickets[i] = tickets
+        self.total += delta
+        i += 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    # Process holding ticket number r, for 0 <= r < total
+    def find(self, r):
+        position = 0
+        step = self.size
+        while step:
+            if position + step < len(self.tree) and self.tree[position + step] <= r:
+                position += step
+                r -= self.tree[position]
+            step >>= 1
+        return position
@@ -0,0 +1,198 @@
+# Compact on-disk schedule traces.
+#
+# A trace file is a 64-byte header, then one fixed-width record per Gantt segment
+# (pid, gap, duration), then the string table. pid is an interned id in order of first
+# appearance, gap is the segment start minus the previous segment's finish (negative only when
+# segments overlap, as on several cores) and duration is the run length. Records are written as
+# they are produced and read back lazily through mmap. The string table holds the policy name
+# and then every pid name, each as a little-endian u32 byte length followed by its UTF-8 bytes,
+# so names of any length or content round-trip.
+import mmap
+import struct
+
+import numpy as np
+
+from .schedule import Schedule
+from .streaming import Segment
+
+MAGIC = b"SCHTRC02"
+HEADER = struct.Struct("<8sQQQ4s4s4s4s16x")  # magic, count, strings offset, names count, 3 dtypes, pad, reserved
+LENGTH = struct.Struct("<I")
+HEADER_SIZE = 64
+NARROW = ("<i4", "<i4", "<u4")
+WIDE = ("<i4", "<i8", "<u8")
+
+
+def _record_dtype(dtypes):
+    return np.dtype([("pid", dtypes[0]), ("gap", dtypes[1]), ("duration", dtypes[2])])
+
+
+def _pack_string(text):
+    data = str(text).encode()
+    return LENGTH.pack(len(data)) + data
+
+
+# Length-prefixed string at offset; returns it and the offset just past it
+def _unpack_string(buffer, offset):
+    (length,) = LENGTH.unpack_from(buffer, offset)
+    offset += LENGTH.size
+    return bytes(buffer[offset:offset + length]).decode(), offset + length
+
+
+# Incremental trace writer: records are appended as segments arrive; close() writes the string
+# table and patches the header. Memory holds only the name interning table.
+class TraceWriter:
+    def __init__(self, path, policy="", wide=False):
+        self.dtypes = WIDE if wide else NARROW
+        self.record = _record_dtype(self.dtypes)
+        self.limits = [np.iinfo(self.record[field]) for field in ("gap", "duration")]
+        self.policy = policy
+        self.file = open(path, "wb")
+        self.file.write(b"\0" * HEADER_SIZE)
+        self.count = 0
+        self.last_finish = 0
+        self.interned = {}
+
+    def _intern(self, name):
+        pid = self.interned.get(name)
+        if pid is None:
+            pid = self.interned[name] = len(self.interned)
+        return pid
+
+    # Append segments given as arrays of names (or ids), starts and finishes
+    def write_many(self, names, starts, finishes):
+        starts = np.asarray(starts, dtype=np.int64)
+        finishes = np.asarray(finishes, dtype=np.int64)
+        if not len(starts):
+            return
+        previous = np.concatenate(([self.last_finish], finishes[:-1]))
+        records = np.empty(len(starts), dtype=self.record)
+        gap = starts - previous
+        duration = finishes - starts
+        for values, limit in ((gap, self.limits[0]), (duration, self.limits[1])):
+            if values.min() < limit.min or values.max() > limit.max:
+                raise ValueError("segment times overflow the narrow trace format; open the writer with wide=True")
+        records["pid"] = [self._intern(name) for name in names]
+        records["gap"] = gap
+        records["duration"] = duration
+        self.file.write(records.tobytes())
+        self.count += len(records)
+        self.last_finish = int(finishes[-1])
+
+    def write(self, name, start, finish):
+        self.write_many([name], [start], [finish])
+
+    # Consume events from streaming.stream(), writing Segment events and passing all events on
+    def record_events(self, events):
+        for event in events:
+            if isinstance(event, Segment):
+                self.write(event.pid, event.start, event.finish)
+            yield event
+
+    def close(self):
+        if self.file.closed:
+            return
+        strings_offset = self.file.tell()
+        self.file.write(_pack_string(self.policy))
+        self.file.write(b"".join(_pack_string(name) for name in self.interned))
+        self.file.seek(0)
+        self.file.write(HEADER.pack(MAGIC, self.count, strings_offset, len(self.interned),
+                                    *(dtype.encode() for dtype in self.dtypes), b""))
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# Write a whole schedule, picking the narrow record format when its times fit
+def write_schedule(schedule, path):
+    segments = np.asarray(schedule.segments, dtype=np.int64).reshape(-1, 3)
+    gaps = segments[:, 1] - np.concatenate(([0], segments[:-1, 2]))
+    durations = segments[:, 2] - segments[:, 1]
+    fits = not len(segments) or (np.iinfo(np.int32).min <= gaps.min() and gaps.max() <= np.iinfo(np.int32).max
+                                 and durations.max() <= np.iinfo(np.uint32).max)
+    with TraceWriter(path, schedule.policy, wide=not fits) as writer:
+        names = [schedule.workload.name(i) for i in segments[:, 0].tolist()]
+        writer.write_many(names, segments[:, 1], segments[:, 2])
+
+
+# Read-only view of a trace file. Record columns are zero-copy views into the mapped file;
+# absolute times are decoded on demand, either in chunks or all at once.
+class ScheduleTrace:
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count, strings_offset, names_count, *dtypes, _ = HEADER.unpack_from(self.map)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a schedule trace")
+        self.policy, self._names_offset = _unpack_string(self.map, strings_offset)
+        self.records = np.frombuffer(self.map, dtype=_record_dtype([d.rstrip(b"\0").decode() for d in dtypes]),
+                                     count=count, offset=HEADER_SIZE)
+        self._names_count = names_count
+        self._names = None
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def names(self):
+        if self._names is None:
+            names = []
+            offset = self._names_offset
+            for _ in range(self._names_count):
+                name, offset = _unpack_string(self.map, offset)
+                names.append(name)
+            self._names = names
+        return self._names
+
+    # Yield (pid ids, starts, finishes) arrays of at most chunk_size segments each
+    def iter_segments(self, chunk_size=1 << 16):
+        last_finish = 0
+        for offset in range(0, len(self), chunk_size):
+            chunk = self.records[offset:offset + chunk_size]
+            # int64 throughout: mixing the unsigned wide duration with int64 would promote to float
+            duration = chunk["duration"].astype(np.int64)
+            ends = np.cumsum(chunk["gap"].astype(np.int64) + duration) + last_finish
+            yield chunk["pid"].astype(np.int64), ends - duration, ends
+            last_finish = int(ends[-1])
+
+    # All segments as a (k, 3) array of (pid id, start, finish)
+    def segments(self):
+        parts = [np.column_stack(chunk) for chunk in self.iter_segments()]
+        return np.concatenate(parts) if parts else np.empty((0, 3), dtype=np.int64)
+
+    # Rebuild a Schedule over the workload the trace was recorded from, e.g. for re-plotting
+    def to_schedule(self, workload):
+        lookup = {workload.name(i): i for i in range(len(workload))}
+        index = np.array([lookup[name] for name in self.names], dtype=np.int64)
+        segments = self.segments()
+        segments[:, 0] = index[segments[:, 0]] if len(segments) else segments[:, 0]
+        completion = np.zeros(len(workload), dtype=np.int64)
+        np.maximum.at(completion, segments[:, 0], segments[:, 2])
+        return Schedule(self.policy, workload, completion, segments)
+
+    def close(self):
+        self.records = None
+        self.map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# Index of the first segment where two traces differ, or None if they are identical
+def first_difference(a, b, chunk_size=1 << 16):
+    for offset, (left, right) in enumerate(zip(a.iter_segments(chunk_size), b.iter_segments(chunk_size))):
+        names_left = np.asarray(a.names, dtype=object)[left[0]]
+        names_right = np.asarray(b.names, dtype=object)[right[0]]
+        differs = (names_left != names_right) | (left[1] != right[1]) | (left[2] != right[2])
+        if differs.any():
+            return offset * chunk_size + int(np.argmax(differs))
+    if len(a) != len(b):
+        return min(len(a), len(b))
+    return None
@@ -0,0 +1,58 @@
+import numpy as np
+
+
+# Result of running a policy over a workload
+class Schedule:
+    __slots__ = ("policy", "workload", "completion", "segments")
+
+    def __init__(self, policy, workload, completion, segments):
+        self.policy = policy
+        self.workload = workload
+        self.completion = np.asarray(completion, dtype=np.int64)  # Completion time of each process, in input order
+        # One (process index, start, finish) entry per context switch, as a list of tuples or a (k, 3) array
+        self.segments = segments
+
+    @property
+    def turnaround(self):
+        return self.completion - self.workload.arrival
+
+    @property
+    def waiting(self):
+        return self.completion - self.workload.arrival - self.workload.burst
+
+    # Time of each process's first dispatch
+    @property
+    def first_start(self):
+        first = np.full(len(self.workload), np.iinfo(np.int64).max, dtype=np.int64)
+        if len(self.segments):
+            columns = np.asarray(self.segments, dtype=np.int64)
+            np.minimum.at(first, columns[:, 0], columns[:, 1])
+        return first
+
+    @property
+    def response(self):
+        return self.first_start - self.workload.arrival
+
+    # Completion minus deadline; positive values are deadline misses
+    @property
+    def lateness(self):
+        if self.workload.deadline is None:
+            raise ValueError("the workload has no deadline column")
+        return self.completion - self.workload.deadline
+
+    @property
+    def missed(self):
+        return self.lateness > 0
+
+    # Gantt segments labelled with process names instead of indices
+    def gantt(self):
+        segments = self.segments.tolist() if isinstance(self.segments, np.ndarray) else self.segments
+        return [(self.workload.name(i), start, finish) for i, start, finish in segments]
+
+
+# Append a run to the Gantt segments, extending the last one if the same process continues
+def add_segment(segments, index, start, finish):
+    if segments and segments[-1][0] == index and segments[-1][2] == start:
+        segments[-1] = (index, segments[-1][1], finish)
+    else:
+        segments.append((index, start, finish))
@@ -0,0 +1,215 @@
+# Live scheduling service on one asyncio event loop.
+#
+# Clients talk line-delimited JSON over TCP, one request per line and one reply per request:
+#
+#     {"op": "submit", "jobs": [{"pid": "J1", "burst": 5, "priority": 2, "arrival": 10}]}
+#     {"op": "advance", "to": 100}          (virtual clock only)
+#     {"op": "projections"}
+#     {"op": "status"}
+#     {"op": "subscribe"}                   (the connection then only receives completion events)
+#
+# A malformed request gets {"ok": false, "error": ...} carrying its "id" if it has one. Bursts must
+# be positive integers, and arrivals and advance targets non-negative integers; a batch with a
+# bad job is rejected whole. A job without an arrival, or with one in the past, arrives at the
+# current clock. With the virtual clock, time moves only on "advance"; with the scaled clock it
+# follows wall time at `scale` time units per second and the dispatcher ticks every `tick` seconds.
+import argparse
+import asyncio
+import json
+
+from .incremental import IncrementalScheduler
+from .process import Process
+
+
+# JSON integers only: no floats, numeric strings or booleans
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+class SchedulerService:
+    def __init__(self, policy="fcfs", time_quantum=5, clock="virtual", scale=1.0, tick=0.01):
+        if clock not in ("virtual", "scaled"):
+            raise ValueError(f"unknown clock {clock!r}, expected 'virtual' or 'scaled'")
+        self.scheduler = IncrementalScheduler(policy, time_quantum)
+        self.clock = clock
+        self.scale = scale
+        self.tick = tick
+        self.subscribers = set()
+        self.submitted = 0
+        self.completed = 0
+        self._server = None
+        self._ticker = None
+        self._epoch = None
+
+    async def start(self, host="127.0.0.1", port=0):
+        loop = asyncio.get_running_loop()
+        self._server = await asyncio.start_server(self._serve, host, port, limit=1 << 24)
+        if self.clock == "scaled":
+            self._epoch = loop.time()
+            self._ticker = asyncio.create_task(self._tick())
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def stop(self):
+        if self._ticker:
+            self._ticker.cancel()
+        self._server.close()
+        await self._server.wait_closed()
+        for queue in self.subscribers:
+            queue.put_nowait(None)
+
+    def now(self):
+        if self.clock == "scaled":
+            return int((asyncio.get_running_loop().time() - self._epoch) * self.scale)
+        return self.scheduler.clock
+
+    def advance(self, t):
+        completions = self.scheduler.advance_to(max(t, self.scheduler.clock))
+        self.completed += len(completions)
+        if completions and self.subscribers:
+            lines = b"".join(json.dumps({"event": "completion", **event._asdict()}).encode() + b"\n"
+                             for event in completions)
+            for queue in self.subscribers:
+                queue.put_nowait(lines)
+        return len(completions)
+
+    async def _tick(self):
+        while True:
+            await asyncio.sleep(self.tick)
+            self.advance(self.now())
+
+    # Submit a batch of jobs; the batch is rejected as a whole if any job is malformed
+    def submit(self, jobs):
+        if not isinstance(jobs, list):
+            raise ValueError("jobs must be a list")
+        now = max(self.now(), self.scheduler.clock)
+        processes = []
+        for i, job in enumerate(jobs):
+            if not isinstance(job, dict):
+                raise ValueError(f"job {i} must be an object")
+            burst, arrival, priority = job.get("burst"), job.get("arrival", now), job.get("priority", 0)
+            if not _is_int(burst) or burst <= 0:
+                raise ValueError(f"job {i}: burst must be a positive integer, got {burst!r}")
+            if not _is_int(arrival) or arrival < 0:
+                raise ValueError(f"job {i}: arrival must be a non-negative integer, got {arrival!r}")
+            if not _is_int(priority):
+                raise ValueError(f"job {i}: priority must be an integer, got {priority!r}")
+            processes.append(Process(job.get("pid", f"J{self.submitted + i + 1}"), max(arrival, now), burst, priority))
+        self.scheduler.submit(processes)
+        self.submitted += len(processes)
+        return len(processes)
+
+    def handle(self, request):
+        if not isinstance(request, dict):
+            raise ValueError("request must be a JSON object")
+        op = request.get("op")
+        if op == "submit":
+            return {"ok": True, "accepted": self.submit(request["jobs"])}
+        if op == "advance":
+            if self.clock != "virtual":
+                raise ValueError("advance is only available with the virtual clock")
+            to = request.get("to")
+            if not _is_int(to) or to < 0:
+                raise ValueError(f"to must be a non-negative integer, got {to!r}")
+            return {"ok": True, "completed": self.advance(to), "clock": self.scheduler.clock}
+        if op == "projections":
+            return {"ok": True, "projections": self.scheduler.projections()}
+        if op == "status":
+            return {"ok": True, "clock": self.now(), "submitted": self.submitted, "completed": self.completed,
+                    "active": len(self.scheduler), "policy": self.scheduler.policy}
+        raise ValueError(f"unknown op {op!r}")
+
+    async def _serve(self, reader, writer):
+        try:
+            while line := await reader.readline():
+                request = {}
+                try:
+                    request = json.loads(line)
+                    if isinstance(request, dict) and request.get("op") == "subscribe":
+                        await self._stream_events(writer)
+                        return
+                    reply = self.handle(request)
+                except (ValueError, KeyError, TypeError) as error:
+                    reply = {"ok": False, "error": str(error)}
+                if isinstance(request, dict) and "id" in request:
+                    reply["id"] = request["id"]
+                writer.write(json.dumps(reply).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _stream_events(self, writer):
+        queue = asyncio.Queue()
+        self.subscribers.add(queue)
+        try:
+            writer.write(b'{"ok": true, "subscribed": true}\n')
+            while (lines := await queue.get()) is not None:
+                writer.write(lines)
+                await writer.drain()
+        finally:
+            self.subscribers.discard(queue)
+
+
+# Client for the service, e.g. as a stand-in for job producers
+class ServiceClient:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, host, port):
+        return cls(*await asyncio.open_connection(host, port, limit=1 << 24))
+
+    async def request(self, op, **fields):
+        self.writer.write(json.dumps({"op": op, **fields}).encode() + b"\n")
+        await self.writer.drain()
+        reply = json.loads(await self.reader.readline())
+        if not reply.get("ok"):
+            raise RuntimeError(reply.get("error"))
+        return reply
+
+    async def submit(self, jobs):
+        return (await self.request("submit", jobs=list(jobs)))["accepted"]
+
+    async def advance(self, to):
+        return await self.request("advance", to=to)
+
+    async def projections(self):
+        return (await self.request("projections"))["projections"]
+
+    async def status(self):
+        return await self.request("status")
+
+    # Switch this connection to completion events and yield them as dicts
+    async def events(self):
+        await self.request("subscribe")
+        while line := await self.reader.readline():
+            yield json.loads(line)
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the live scheduling service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7878)
+    parser.add_argument("--policy", default="fcfs")
+    parser.add_argument("--time-quantum", type=int, default=5)
+    parser.add_argument("--clock", choices=("virtual", "scaled"), default="virtual")
+    parser.add_argument("--scale", type=float, default=1.0, help="time units per second for the scaled clock")
+    args = parser.parse_args(argv)
+
+    async def serve():
+        service = SchedulerService(args.policy, args.time_quantum, args.clock, args.scale)
+        host, port = await service.start(args.host, args.port)
+        print(f"Scheduling service ({args.policy}, {args.clock} clock) listening on {host}:{port}", flush=True)
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    main()
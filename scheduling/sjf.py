@@ -0,0 +1,57 @@
+import numpy as np
+
+from .dispatch import run_nonpreemptive
+from .runqueue import heap_ops
+from .schedule import Schedule, add_segment
+from .workload import as_workload
+
+
+# Non-preemptive Shortest Job First: shortest burst among arrived processes, ties by input order
+def sjf(processes, counters=None):
+    workload = as_workload(processes)
+    return run_nonpreemptive("sjf", workload, workload.burst, counters=counters)
+
+
+# Preemptive Shortest Job First (Shortest Remaining Time First), event driven
+def srtf(processes, counters=None):
+    workload = as_workload(processes)
+    arrival = workload.arrival.tolist()
+    burst = workload.burst.tolist()
+    n = len(workload)
+    remaining_time = list(burst)
+    completion = [0] * n
+    segments = []
+    arrival_order = np.argsort(workload.arrival, kind="stable").tolist()
+    ready_queue = []  # Min-heap of (remaining time, process index)
+    push, pop = heap_ops(counters)
+    next_arrival = 0
+    time = 0
+    completed = 0
+    while completed != n:
+        # Admit every process that has arrived by now
+        while next_arrival < n and arrival[arrival_order[next_arrival]] <= time:
+            index = arrival_order[next_arrival]
+            push(ready_queue, (remaining_time[index], index))
+            next_arrival += 1
+
+        if not ready_queue:
+            # CPU is idle, jump straight to the next arrival
+            time = arrival[arrival_order[next_arrival]]
+            continue
+
+        # Run the shortest job until it finishes or the next arrival may preempt it
+        _, index = pop(ready_queue)
+        run_until = time + remaining_time[index]
+        if next_arrival < n:
+            run_until = min(run_until, arrival[arrival_order[next_arrival]])
+
+        add_segment(segments, index, time, run_until)
+        remaining_time[index] -= run_until - time
+        time = run_until
+        if remaining_time[index] == 0:
+            completion[index] = time
+            completed += 1
+        else:
+            push(ready_queue, (remaining_time[index], index))
+
+    return Schedule("srtf", workload, completion, segments)
@@ -0,0 +1,248 @@
+import heapq
+from collections import deque, namedtuple
+
+# Events yielded by the streaming engines
+Segment = namedtuple("Segment", "pid start finish")
+Completion = namedtuple("Completion", "pid arrival burst first_start completion")
+
+
+# Ready queue ordered by a per-policy key; ties fall back to arrival sequence
+class _HeapQueue:
+    __slots__ = ("heap", "key")
+
+    def __init__(self, key):
+        self.heap = []
+        self.key = key
+
+    def push(self, job):
+        heapq.heappush(self.heap, (self.key(job), job[0], job))
+
+    def pop(self):
+        return heapq.heappop(self.heap)[2]
+
+    # Same queue over copies of the jobs; the heap order carries over unchanged
+    def copy(self):
+        clone = _HeapQueue(self.key)
+        clone.heap = [(key, sequence, job.copy()) for key, sequence, job in self.heap]
+        return clone
+
+    def __len__(self):
+        return len(self.heap)
+
+
+# FIFO ready queue for Round-Robin
+class _FifoQueue:
+    __slots__ = ("queue",)
+
+    def __init__(self):
+        self.queue = deque()
+
+    def push(self, job):
+        self.queue.append(job)
+
+    def pop(self):
+        return self.queue.popleft()
+
+    def copy(self):
+        clone = _FifoQueue()
+        clone.queue = deque(job.copy() for job in self.queue)
+        return clone
+
+    def __len__(self):
+        return len(self.queue)
+
+
+# Job state: [sequence, pid, arrival, burst, priority, remaining, first start]
+SEQ, PID, ARRIVAL, BURST, PRIORITY, REMAINING, FIRST_START = range(7)
+
+# policy: (ready queue factory, preemptive on arrival, uses time quantum)
+STREAM_POLICIES = {
+    "fcfs": (lambda: _HeapQueue(lambda job: job[ARRIVAL]), False, False),
+    "rr": (_FifoQueue, False, True),
+    "sjf": (lambda: _HeapQueue(lambda job: job[BURST]), False, False),
+    "srtf": (lambda: _HeapQueue(lambda job: job[REMAINING]), True, False),
+    "priority": (lambda: _HeapQueue(lambda job: (job[PRIORITY], job[ARRIVAL])), False, False),
+    "priority_preemptive": (lambda: _HeapQueue(lambda job: (job[PRIORITY], job[ARRIVAL])), True, False),
+}
+
+
+# Run a policy over an iterator of Process records in non-decreasing arrival order, yielding
+# Segment events (coalesced, one per context switch) and Completion events as they happen.
+# Memory is bounded by the ready queue, not by the length of the trace.
+def stream(policy, arrivals, time_quantum=5):
+    try:
+        make_queue, preemptive, quantum = STREAM_POLICIES[policy]
+    except KeyError:
+        raise ValueError(f"unknown streaming policy {policy!r}, expected one of: {', '.join(STREAM_POLICIES)}") from None
+    if quantum and time_quantum <= 0:
+        raise ValueError("time_quantum must be positive")
+
+    arrivals = iter(arrivals)
+    ready_queue = make_queue()
+    sequence = 0
+    pending = next(arrivals, None)
+    time = 0
+    open_segment = None  # Last segment, held back until a different process runs
+
+    # Move every process that has arrived by now into the ready queue
+    def admit():
+        nonlocal pending, sequence
+        while pending is not None and pending.arrival <= time:
+            ready_queue.push([sequence, pending.pid, pending.arrival, pending.burst, pending.priority, pending.burst, None])
+            sequence += 1
+            last_arrival = pending.arrival
+            pending = next(arrivals, None)
+            if pending is not None and pending.arrival < last_arrival:
+                raise ValueError("arrivals must be in non-decreasing arrival order")
+
+    while pending is not None or ready_queue:
+        # CPU is idle, jump straight to the next arrival
+        if not ready_queue:
+            time = max(time, pending.arrival)
+        admit()
+
+        job = ready_queue.pop()
+        run = job[REMAINING]
+        if quantum:
+            run = min(run, time_quantum)
+        if preemptive and pending is not None:
+            run = min(run, pending.arrival - time)
+        if job[FIRST_START] is None:
+            job[FIRST_START] = time
+
+        if open_segment is not None and open_segment.pid == job[PID] and open_segment.finish == time:
+            open_segment = Segment(job[PID], open_segment.start, time + run)
+        else:
+            if open_segment is not None:
+                yield open_segment
+            open_segment = Segment(job[PID], time, time + run)
+
+        time += run
+        job[REMAINING] -= run
+        # Arrivals during the slice are queued before the preempted process
+        admit()
+        if job[REMAINING] == 0:
+            yield Completion(job[PID], job[ARRIVAL], job[BURST], job[FIRST_START], time)
+        else:
+            ready_queue.push(job)
+
+    if open_segment is not None:
+        yield open_segment
+
+
+# Running count, mean and maximum (Welford update, constant memory)
+class RunningStats:
+    __slots__ = ("count", "mean", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.max = 0
+
+    def add(self, value):
+        self.count += 1
+        self.mean += (value - self.mean) / self.count
+        if self.count == 1 or value > self.max:
+            self.max = value
+
+
+# HDR-style log-linear histogram over non-negative integers. Values below 2**precision are exact;
+# larger ones land in buckets whose width is at most 2**-(precision - 1) of their value, so the
+# number of buckets grows with log(max value), not with the number of samples.
+class LogHistogram:
+    __slots__ = ("precision", "counts", "count")
+
+    def __init__(self, precision=7):
+        self.precision = precision
+        self.counts = {}
+        self.count = 0
+
+    def _index(self, value):
+        shift = value.bit_length() - self.precision
+        if shift <= 0:
+            return value
+        return (shift << (self.precision - 1)) + (value >> shift)
+
+    # Smallest value and width of a bucket
+    def _bounds(self, index):
+        if index < (1 << self.precision):
+            return index, 1
+        shift = (index >> (self.precision - 1)) - 1
+        mantissa = index - (shift << (self.precision - 1))
+        return mantissa << shift, 1 << shift
+
+    def add(self, value):
+        index = self._index(int(value))
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+
+    def percentile(self, q):
+        if not self.count:
+            return 0.0
+        target = max(1, -(-q * self.count // 100))  # Rank of the q-th percentile, rounded up
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                low, width = self._bounds(index)
+                return float(low + (width - 1) / 2)
+        return float(self._bounds(max(self.counts))[0])
+
+
+# Completions per fixed time window, keeping only the most recent windows
+class Throughput:
+    __slots__ = ("window", "windows")
+
+    def __init__(self, window, history=64):
+        self.window = window
+        self.windows = deque(maxlen=history)  # (window start, completions)
+
+    def add(self, completion_time):
+        start = completion_time - completion_time % self.window
+        if self.windows and self.windows[-1][0] == start:
+            self.windows[-1] = (start, self.windows[-1][1] + 1)
+        else:
+            self.windows.append((start, 1))
+
+
+# Online counterpart of metrics.summarize(): feed it events from stream(); percentiles are
+# approximate to the histogram precision.
+class OnlineSummary:
+    __slots__ = ("stats", "histograms", "throughput")
+
+    def __init__(self, window=100, precision=7):
+        self.stats = {metric: RunningStats() for metric in ("turnaround", "waiting", "response")}
+        self.histograms = {metric: LogHistogram(precision) for metric in self.stats}
+        self.throughput = Throughput(window)
+
+    def update(self, event):
+        if not isinstance(event, Completion):
+            return
+        turnaround = event.completion - event.arrival
+        values = {
+            "turnaround": turnaround,
+            "waiting": turnaround - event.burst,
+            "response": event.first_start - event.arrival,
+        }
+        for metric, value in values.items():
+            self.stats[metric].add(value)
+            self.histograms[metric].add(value)
+        self.throughput.add(event.completion)
+
+    def consume(self, events):
+        for event in events:
+            self.update(event)
+            yield event
+
+    def summary(self):
+        summary = {}
+        for metric, stats in self.stats.items():
+            histogram = self.histograms[metric]
+            summary[metric] = {
+                "mean": stats.mean,
+                "p50": histogram.percentile(50),
+                "p95": histogram.percentile(95),
+                "p99": histogram.percentile(99),
+                "max": float(stats.max),
+            }
+        return summary
@@ -0,0 +1,163 @@
+import argparse
+import itertools
+import json
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .metrics import METRICS, STATISTICS, summarize
+from .policies import get_policy
+from . import traces
+from .cache import ResultCache, cache_key, fingerprint
+from .workload import Workload
+
+# Column layout of the shared memory block: (attribute, dtype), packed back to back
+SHARED_COLUMNS = (("arrival", np.int64), ("burst", np.int64), ("priority", np.int32), ("pid", np.int32))
+# Appended after the others when the workload has deadlines
+SHARED_DEADLINE = ("deadline", np.int64)
+
+_worker_workload = None
+_worker_memory = None
+
+
+# Expand {policy: {parameter: [values]}} into one (policy, params) run per grid point
+def expand_grid(grid):
+    runs = []
+    for policy, parameters in grid.items():
+        get_policy(policy)  # Fail fast on unknown policies
+        keys = list(parameters or {})
+        for values in itertools.product(*(parameters[key] for key in keys)):
+            runs.append((policy, dict(zip(keys, values))))
+    return runs
+
+
+# Copy the workload columns into one shared memory block that workers map without pickling
+def _shared_columns(has_deadlines):
+    return SHARED_COLUMNS + (SHARED_DEADLINE,) if has_deadlines else SHARED_COLUMNS
+
+
+def _share_workload(workload):
+    n = len(workload)
+    layout = _shared_columns(workload.deadline is not None)
+    size = sum(np.dtype(dtype).itemsize for _, dtype in layout) * n
+    memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    offset = 0
+    for attribute, dtype in layout:
+        column = np.ndarray(n, dtype=dtype, buffer=memory.buf, offset=offset)
+        column[:] = getattr(workload, attribute)
+        offset += column.nbytes
+    return memory
+
+
+def _attach_workload(name, n, has_deadlines=False):
+    global _worker_workload, _worker_memory
+    _worker_memory = shared_memory.SharedMemory(name=name)
+    columns = {"deadline": None}
+    offset = 0
+    for attribute, dtype in _shared_columns(has_deadlines):
+        columns[attribute] = np.ndarray(n, dtype=dtype, buffer=_worker_memory.buf, offset=offset)
+        offset += columns[attribute].nbytes
+    _worker_workload = Workload(columns["arrival"], columns["burst"], columns["priority"], columns["pid"],
+                                deadline=columns["deadline"])
+
+
+def _run(run):
+    policy, params, keep_completion = run
+    schedule = get_policy(policy)(_worker_workload, **params)
+    return (schedule.completion if keep_completion else None), summarize(schedule)
+
+
+# Run every grid point over the workload on a process pool and collect one row per run.
+# With a ResultCache, only the grid points it does not already hold are computed.
+def sweep(workload, grid, max_workers=None, cache=None):
+    runs = expand_grid(grid)
+    summaries = [None] * len(runs)
+    keys = [None] * len(runs)
+    if cache is not None:
+        workload_fingerprint = fingerprint(workload)
+        for i, (policy, params) in enumerate(runs):
+            keys[i] = cache_key(workload_fingerprint, policy, params)
+            result = cache.get(keys[i])
+            if result is not None:
+                summaries[i] = result.summary
+    missing = [i for i, summary in enumerate(summaries) if summary is None]
+
+    if missing:
+        memory = _share_workload(workload)
+        try:
+            with ProcessPoolExecutor(max_workers, initializer=_attach_workload, initargs=(memory.name, len(workload), workload.deadline is not None)) as pool:
+                results = pool.map(_run, [(*runs[i], cache is not None) for i in missing])
+                for i, (completion, summary) in zip(missing, results):
+                    summaries[i] = summary
+                    if cache is not None:
+                        cache.put(keys[i], completion, summary)
+        finally:
+            memory.close()
+            memory.unlink()
+
+    rows = []
+    for (policy, params), summary in zip(runs, summaries):
+        row = {"policy": policy, "params": params}
+        for metric in METRICS + (("lateness",) if "lateness" in summary else ()):
+            for statistic in STATISTICS:
+                row[f"{metric}_{statistic}"] = summary[metric][statistic]
+        if "miss_rate" in summary:
+            row["miss_rate"] = summary["miss_rate"]
+        rows.append(row)
+    return rows
+
+
+# Function to print sweep results as a fixed-width table
+def print_table(rows, columns=("waiting_mean", "waiting_p95", "turnaround_mean", "turnaround_p95", "response_p95")):
+    print(f"{'Policy':<22}{'Params':<24}" + "".join(f"{column:<18}" for column in columns))
+    for row in rows:
+        params = ",".join(f"{key}={value}" for key, value in row["params"].items())
+        print(f"{row['policy']:<22}{params:<24}" + "".join(f"{row[column]:<18.2f}" for column in columns))
+
+
+# A grid value is an integer or a list of integers, the latter passed on as a tuple
+def _grid_value(key, value):
+    if isinstance(value, list) and value and all(type(item) is int for item in value):
+        return tuple(value)
+    if type(value) is not int:
+        raise ValueError(f"{key} values must be integers or JSON lists of integers, got {json.dumps(value)}")
+    return value
+
+
+# Parse "policy" or "policy:param=v1,v2:param2=v3" grid arguments. Values are JSON integers or
+# lists of integers, so list parameters sweep too: mlfq:quanta=[4,8,16],[8,16,32]
+def parse_grid(specs):
+    grid = {}
+    for spec in specs:
+        policy, *assignments = spec.split(":")
+        parameters = grid.setdefault(policy, {})
+        for assignment in assignments:
+            key, _, values = assignment.partition("=")
+            try:
+                values = json.loads(f"[{values}]")
+            except json.JSONDecodeError:
+                raise ValueError(f"cannot parse {key} values {values!r}") from None
+            if not values:
+                raise ValueError(f"{key} needs at least one value")
+            parameters[key] = [_grid_value(key, value) for value in values]
+    return grid
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep scheduling policies and parameters over a workload trace")
+    parser.add_argument("workload", help="CSV or JSONL trace, or a binary workload directory")
+    parser.add_argument("--grid", action="append", required=True,
+                        help="policy[:param=v1,v2...], e.g. rr:time_quantum=2,5,10 or mlfq:quanta=[4,8],[8,16] (repeatable)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--cache", nargs="?", const="", default=None, metavar="DIR",
+                        help="reuse cached results (default directory: $SCHEDULING_CACHE or ~/.cache/scheduling)")
+    args = parser.parse_args(argv)
+
+    cache = None if args.cache is None else ResultCache(args.cache or None)
+    rows = sweep(traces.load(args.workload, names=False), parse_grid(args.grid), args.workers, cache)
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
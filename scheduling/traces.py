@@ -0,0 +1,181 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+
+import numpy as np
+
+from .workload import Workload
+
+# Trace columns; pid, priority and deadline are optional
+COLUMNS = ("pid", "arrival", "burst", "priority", "deadline")
+
+# On-disk dtypes of the binary workload format, one raw little-endian file per column
+BINARY_COLUMNS = (("arrival", "<i8"), ("burst", "<i8"), ("priority", "<i4"), ("pid", "<i4"))
+# Written only for workloads that have deadlines; older readers ignore it
+DEADLINE_COLUMN = ("deadline", "<i8")
+# Version 2 stores names as names.bin (UTF-8 labels back to back) plus names.offsets (<i8 end of
+# each label), so labels may contain any character; version 1 used newline-separated names.txt
+BINARY_VERSION = 2
+
+CHUNK_SIZE = 1 << 16
+
+
+# Turn an iterator of row dicts into Workload chunks of at most chunk_size rows
+def _chunks(rows, chunk_size, offset=0):
+    while True:
+        batch = list(itertools.islice(rows, chunk_size))
+        if not batch:
+            return
+        names = [row.get("pid") or f"P{offset + i + 1}" for i, row in enumerate(batch)]
+        deadlines = [row.get("deadline") for row in batch]
+        deadlines = [None if deadline in (None, "") else int(deadline) for deadline in deadlines]
+        if None in deadlines and any(deadline is not None for deadline in deadlines):
+            raise ValueError(f"deadline missing from some rows after row {offset}; give every row one or none")
+        yield Workload(
+            [int(row["arrival"]) for row in batch],
+            [int(row["burst"]) for row in batch],
+            [int(row.get("priority") or 0) for row in batch],
+            names=[str(name) for name in names],
+            deadline=None if None in deadlines else deadlines,
+        )
+        offset += len(batch)
+
+
+# Stream a CSV trace (header row naming at least arrival and burst) as Workload chunks
+def iter_csv(path, chunk_size=CHUNK_SIZE):
+    with open(path, newline="") as f:
+        yield from _chunks(csv.DictReader(f), chunk_size)
+
+
+# Stream a JSON Lines trace, one {"pid", "arrival", "burst", "priority", "deadline"} object per line
+def iter_jsonl(path, chunk_size=CHUNK_SIZE):
+    with open(path) as f:
+        yield from _chunks((json.loads(line) for line in f if line.strip()), chunk_size)
+
+
+# Join chunks into a single in-memory workload
+def concat(chunks):
+    chunks = list(chunks)
+    names = [name for chunk in chunks for name in chunk.names]
+    has_deadlines = [chunk.deadline is not None for chunk in chunks]
+    if any(has_deadlines) and not all(has_deadlines):
+        raise ValueError("either every chunk or none must have a deadline column")
+    return Workload(
+        np.concatenate([chunk.arrival for chunk in chunks] or [np.empty(0, np.int64)]),
+        np.concatenate([chunk.burst for chunk in chunks] or [np.empty(0, np.int64)]),
+        np.concatenate([chunk.priority for chunk in chunks] or [np.empty(0, np.int32)]),
+        names=names,
+        deadline=np.concatenate([chunk.deadline for chunk in chunks]) if chunks and all(has_deadlines) else None,
+    )
+
+
+def read_csv(path):
+    return concat(iter_csv(path))
+
+
+def read_jsonl(path):
+    return concat(iter_jsonl(path))
+
+
+# Write workload chunks to the binary columnar format: a directory holding meta.json, one raw
+# file per column and the names table. Chunks are appended as they arrive, so memory stays constant.
+def write_binary(chunks, path):
+    if isinstance(chunks, Workload):
+        chunks = [chunks]
+    os.makedirs(path, exist_ok=True)
+    columns = list(BINARY_COLUMNS)
+    files = {column: open(os.path.join(path, f"{column}.bin"), "wb") for column, _ in columns}
+    n = 0
+    names_size = 0
+    has_names = True
+    try:
+        with open(os.path.join(path, "names.bin"), "wb") as names_file, \
+                open(os.path.join(path, "names.offsets"), "wb") as offsets_file:
+            for chunk in chunks:
+                # The first chunk decides whether the workload has deadlines
+                if not n and chunk.deadline is not None and DEADLINE_COLUMN not in columns:
+                    columns.append(DEADLINE_COLUMN)
+                    files["deadline"] = open(os.path.join(path, "deadline.bin"), "wb")
+                if (chunk.deadline is not None) != (DEADLINE_COLUMN in columns):
+                    raise ValueError("either every chunk or none must have a deadline column")
+                # Rows get global pid indices; the names table holds the label of each pid in order
+                pid = np.arange(n, n + len(chunk), dtype=np.int32)
+                for column, dtype in columns:
+                    values = pid if column == "pid" else getattr(chunk, column)
+                    files[column].write(values.astype(dtype, copy=False).tobytes())
+                if chunk.names is None:
+                    has_names = False
+                elif has_names:
+                    labels = [chunk.name(i).encode() for i in range(len(chunk))]
+                    names_file.write(b"".join(labels))
+                    ends = names_size + np.cumsum([len(label) for label in labels], dtype=np.int64)
+                    offsets_file.write(ends.astype("<i8").tobytes())
+                    names_size = int(ends[-1]) if len(ends) else names_size
+                n += len(chunk)
+    finally:
+        for f in files.values():
+            f.close()
+
+    if not has_names:
+        os.remove(os.path.join(path, "names.bin"))
+        os.remove(os.path.join(path, "names.offsets"))
+    meta = {"version": BINARY_VERSION, "rows": n, "columns": dict(columns), "names": has_names}
+    with open(os.path.join(path, "meta.json"), "w") as f:
+        json.dump(meta, f)
+
+
+# Open a binary workload with every column memory-mapped read-only, so nothing is parsed or copied.
+# Process names are only read when requested.
+def open_binary(path, names=False):
+    with open(os.path.join(path, "meta.json")) as f:
+        meta = json.load(f)
+    if meta.get("version") not in (1, BINARY_VERSION):
+        raise ValueError(f"unsupported binary workload version {meta.get('version')!r}")
+
+    n = meta["rows"]
+    columns = {"deadline": None}
+    for column, dtype in BINARY_COLUMNS + ((DEADLINE_COLUMN,) if "deadline" in meta["columns"] else ()):
+        if n:
+            columns[column] = np.memmap(os.path.join(path, f"{column}.bin"), dtype=dtype, mode="r", shape=(n,))
+        else:
+            columns[column] = np.empty(0, dtype=dtype)
+
+    labels = None
+    if names and meta["names"] and meta["version"] == 1:
+        with open(os.path.join(path, "names.txt")) as f:
+            labels = f.read().splitlines()
+    elif names and meta["names"]:
+        with open(os.path.join(path, "names.bin"), "rb") as f:
+            data = f.read()
+        ends = np.fromfile(os.path.join(path, "names.offsets"), dtype="<i8").tolist()
+        labels = [data[start:end].decode() for start, end in zip([0] + ends[:-1], ends)]
+    return Workload(columns["arrival"], columns["burst"], columns["priority"], columns["pid"], names=labels,
+                    deadline=columns["deadline"])
+
+
+# Load a trace by file type: .csv, .jsonl, or a binary workload directory
+def load(path, names=True):
+    if os.path.isdir(path):
+        return open_binary(path, names)
+    if path.endswith(".csv"):
+        return read_csv(path)
+    if path.endswith((".jsonl", ".ndjson")):
+        return read_jsonl(path)
+    raise ValueError(f"unrecognized trace format: {path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert a CSV or JSONL trace to the binary workload format")
+    parser.add_argument("source", help=".csv or .jsonl trace")
+    parser.add_argument("destination", help="output directory")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    stream = iter_csv if args.source.endswith(".csv") else iter_jsonl
+    write_binary(stream(args.source, args.chunk_size), args.destination)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,464 @@
+# Differential and property-based checking of the scheduling engines.
+#
+# Random small workloads, biased towards edge cases (late first arrival, idle gaps, ties,
+# single processes, unit bursts), run through each engine. Every schedule must satisfy the
+# scheduling invariants and its policy's ordering rule, and must match a slow tick-by-tick
+# reference simulator segment for segment. The incremental, overhead, multi-core, vectorized
+# batch and partitioned engines are compared against the batch engine of the same policy on the
+# same (unsorted) workload, and the streaming engine, which needs arrivals in order, on the
+# arrival-ordered one. Failing cases are shrunk to a minimal workload before they are reported:
+#
+#     python -m scheduling.verify --cases 10000 --seed 0
+import argparse
+import random
+import time
+from collections import deque
+
+import numpy as np
+
+from .policies import get_policy
+from .process import Process
+from .schedule import Schedule
+from .streaming import STREAM_POLICIES
+from .workload import Workload
+
+VERIFY_POLICIES = ("fcfs", "rr", "sjf", "srtf", "priority", "priority_preemptive", "mlfq", "cfs", "stride", "lottery",
+                   "edf", "llf")
+# Policies with a tick-by-tick reference; the others get the invariant checks only
+REFERENCE_POLICIES = ("fcfs", "rr", "sjf", "srtf", "priority", "priority_preemptive", "mlfq", "edf", "llf")
+
+# Tie-broken selection key of process i, as used by the engines
+KEYS = {
+    "fcfs": lambda i, arrival, burst, priority, remaining, deadline: (arrival[i], i),
+    "sjf": lambda i, arrival, burst, priority, remaining, deadline: (burst[i], i),
+    "srtf": lambda i, arrival, burst, priority, remaining, deadline: (remaining[i], i),
+    "priority": lambda i, arrival, burst, priority, remaining, deadline: (priority[i], arrival[i], i),
+    "priority_preemptive": lambda i, arrival, burst, priority, remaining, deadline: (priority[i], arrival[i], i),
+    "edf": lambda i, arrival, burst, priority, remaining, deadline: (deadline[i], arrival[i], i),
+}
+NONPREEMPTIVE = ("fcfs", "sjf", "priority")
+
+
+# Random workload of up to max_processes, with a share of cases drawn to hit edge cases
+def random_workload(rng, max_processes=8, max_arrival=30, max_burst=10):
+    n = rng.randint(1, max_processes)
+    shape = rng.random()
+    if shape < 0.15:  # Everything arrives together
+        arrival = [rng.randint(0, max_arrival)] * n
+    elif shape < 0.3:  # Sparse arrivals with idle gaps between them
+        arrival = sorted(rng.randint(0, max_arrival * 4) for _ in range(n))
+    else:
+        arrival = [rng.randint(0, max_arrival) for _ in range(n)]
+    if rng.random() < 0.2:  # No process at t=0
+        arrival = [a + rng.randint(1, 10) for a in arrival]
+    burst_cap = 1 if rng.random() < 0.1 else max_burst
+    burst = [rng.randint(1, burst_cap) for _ in range(n)]
+    if rng.random() < 0.2:  # Ties on burst
+        burst = [burst[0]] * n
+    priority = [rng.randint(0, 3) for _ in range(n)]
+    deadline = [a + b + rng.randint(0, 3 * max_burst) for a, b in zip(arrival, burst)]
+    return Workload(arrival, burst, priority, deadline=deadline)
+
+
+# Slow, obviously correct simulator that decides who runs one time unit at a time. rr uses
+# time_quantum; mlfq uses quanta and boost_interval as its engine does.
+def reference(policy, workload, time_quantum=5, quanta=(5, 10, 20), boost_interval=None):
+    n = len(workload)
+    arrival = workload.arrival.tolist()
+    burst = workload.burst.tolist()
+    priority = workload.priority.tolist()
+    deadline = workload.deadline.tolist() if workload.deadline is not None else None
+    remaining = list(burst)
+    completion = [0] * n
+    timeline = []
+    queue = deque()
+    queues = [deque() for _ in quanta]  # mlfq levels, highest first
+    level = [0] * n
+    allotment = [quanta[0]] * n
+    running = -1
+    used = 0
+    t = 0
+    while any(remaining):
+        if policy == "rr":
+            queue.extend(i for i in range(n) if arrival[i] == t)
+            if running >= 0 and (remaining[running] == 0 or used == time_quantum):
+                if remaining[running]:
+                    queue.append(running)
+                running = -1
+            if running < 0 and queue:
+                running, used = queue.popleft(), 0
+        elif policy == "mlfq":
+            queues[0].extend(i for i in range(n) if arrival[i] == t)
+            if running >= 0 and not remaining[running]:
+                running = -1
+            elif running >= 0 and not allotment[running]:
+                level[running] = min(level[running] + 1, len(quanta) - 1)
+                allotment[running] = quanta[level[running]]
+                queues[level[running]].append(running)
+                running = -1
+            boosting = boost_interval and t and t % boost_interval == 0
+            # A boost or a process waiting at a higher level preempts; it resumes first in its level
+            if running >= 0 and (boosting or any(queues[:level[running]])):
+                queues[level[running]].appendleft(running)
+                running = -1
+            if boosting:
+                for lower in queues[1:]:
+                    for i in lower:
+                        level[i], allotment[i] = 0, quanta[0]
+                    queues[0].extend(lower)
+                    lower.clear()
+            if running < 0:
+                running = next((q.popleft() for q in queues if q), -1)
+        elif policy == "llf":
+            # Least laxity runs; the running process keeps the CPU unless another has strictly less
+            ready = [i for i in range(n) if arrival[i] <= t and remaining[i]]
+            laxity = lambda i: (deadline[i] - t - remaining[i], i)
+            if running < 0 or not remaining[running]:
+                running = min(ready, key=laxity) if ready else -1
+            else:
+                others = [i for i in ready if i != running]
+                if others and laxity(min(others, key=laxity))[0] < laxity(running)[0]:
+                    running = min(others, key=laxity)
+        else:
+            ready = [i for i in range(n) if arrival[i] <= t and remaining[i]]
+            if policy not in NONPREEMPTIVE or running < 0 or not remaining[running]:
+                key = KEYS[policy]
+                running = min(ready, key=lambda i: key(i, arrival, burst, priority, remaining, deadline)) if ready else -1
+        timeline.append(running)
+        if running >= 0:
+            remaining[running] -= 1
+            allotment[running] -= 1
+            used += 1
+            if not remaining[running]:
+                completion[running] = t + 1
+        t += 1
+
+    segments = []
+    for start, i in enumerate(timeline):
+        if i < 0:
+            continue
+        if segments and segments[-1][0] == i and segments[-1][2] == start:
+            segments[-1] = (i, segments[-1][1], start + 1)
+        else:
+            segments.append((i, start, start + 1))
+    return Schedule(policy, workload, completion, segments)
+
+
+def _segment_list(schedule):
+    segments = schedule.segments.tolist() if isinstance(schedule.segments, np.ndarray) else schedule.segments
+    return [tuple(segment) for segment in segments]
+
+
+# Invariants every single-CPU schedule must satisfy; returns a list of violations
+def check_invariants(schedule):
+    workload = schedule.workload
+    n = len(workload)
+    arrival = workload.arrival.tolist()
+    burst = workload.burst.tolist()
+    completion = schedule.completion.tolist()
+    segments = sorted(_segment_list(schedule), key=lambda segment: segment[1])
+    problems = []
+
+    executed = [0] * n
+    last_finish = [None] * n
+    for i, start, finish in segments:
+        if not 0 <= i < n or start >= finish:
+            problems.append(f"malformed segment {(i, start, finish)}")
+            continue
+        if start < arrival[i]:
+            problems.append(f"process {i} runs at {start} before arriving at {arrival[i]}")
+        executed[i] += finish - start
+        last_finish[i] = finish if last_finish[i] is None else max(last_finish[i], finish)
+    for previous, current in zip(segments, segments[1:]):
+        if current[1] < previous[2]:
+            problems.append(f"segments {previous} and {current} overlap")
+
+    for i in range(n):
+        if executed[i] != burst[i]:
+            problems.append(f"process {i} ran for {executed[i]}, its burst is {burst[i]}")
+        if completion[i] < arrival[i] + burst[i]:
+            problems.append(f"process {i} completes at {completion[i]} before arrival + burst")
+        if last_finish[i] is not None and completion[i] != last_finish[i]:
+            problems.append(f"process {i} completes at {completion[i]}, its last segment ends at {last_finish[i]}")
+
+    # Work conservation: every work-conserving policy has the busy periods of FCFS
+    expected = []
+    for a, b in sorted(zip(arrival, burst)):
+        if expected and a <= expected[-1][1]:
+            expected[-1][1] += b
+        else:
+            expected.append([a, a + b])
+    busy = []
+    for _, start, finish in segments:
+        if busy and start <= busy[-1][1]:
+            busy[-1][1] = max(busy[-1][1], finish)
+        else:
+            busy.append([start, finish])
+    if busy != expected:
+        problems.append(f"CPU busy periods {busy} differ from the work-conserving {expected}")
+    return problems
+
+
+# Policy-specific dispatch rules, checked at every segment start and every arrival during a segment
+def check_ordering(schedule, policy, time_quantum=5):
+    workload = schedule.workload
+    n = len(workload)
+    arrival = workload.arrival.tolist()
+    burst = workload.burst.tolist()
+    priority = workload.priority.tolist()
+    deadline = workload.deadline.tolist() if workload.deadline is not None else None
+    segments = sorted(_segment_list(schedule), key=lambda segment: segment[1])
+    problems = []
+
+    def remaining_at(t):
+        remaining = list(burst)
+        for i, start, finish in segments:
+            remaining[i] -= max(0, min(finish, t) - start)
+        return remaining
+
+    def waiting_at(t, running):
+        remaining = remaining_at(t)
+        return [j for j in range(n) if j != running and arrival[j] <= t and remaining[j]], remaining
+
+    if policy in NONPREEMPTIVE:
+        counts = [0] * n
+        for i, start, finish in segments:
+            counts[i] += 1
+            others, remaining = waiting_at(start, i)
+            key = KEYS[policy]
+            better = [j for j in others if key(j, arrival, burst, priority, remaining, deadline) < key(i, arrival, burst, priority, remaining, deadline)]
+            if better:
+                problems.append(f"{policy} dispatches {i} at {start} ahead of {better[0]}")
+        problems += [f"{policy} splits process {i} into {count} segments" for i, count in enumerate(counts) if count != 1]
+    elif policy in KEYS:
+        key = KEYS[policy]
+        for i, start, finish in segments:
+            for t in sorted({start} | {a for a in arrival if start < a < finish}):
+                others, remaining = waiting_at(t, i)
+                better = [j for j in others if key(j, arrival, burst, priority, remaining, deadline) < key(i, arrival, burst, priority, remaining, deadline)]
+                if better:
+                    problems.append(f"{policy} runs {i} at {t} while {better[0]} should preempt it")
+    elif policy == "rr":
+        for i, start, finish in segments:
+            for t in range(start + time_quantum, finish, time_quantum):
+                others, _ = waiting_at(t, i)
+                if others:
+                    problems.append(f"rr runs {i} past its quantum at {t} while {others[0]} waits")
+    return problems
+
+
+def _sorted_by_arrival(workload):
+    order = np.argsort(workload.arrival, kind="stable")
+    return Workload(workload.arrival[order], workload.burst[order], workload.priority[order],
+                    deadline=None if workload.deadline is None else workload.deadline[order])
+
+
+# Completion times from the other engines for the same policy on the workload as given. The
+# streaming engine takes arrivals in order and breaks ties by their sequence, so it is compared
+# on the arrival-ordered workload (where sequence and input order coincide) by the caller.
+def _other_engines(policy, workload, time_quantum):
+    from .incremental import IncrementalScheduler
+    from .multicore import multicore
+
+    scheduler = IncrementalScheduler(policy, time_quantum)
+    scheduler.submit(_records(workload))
+    completion = [0] * len(workload)
+    for event in scheduler.advance_to(float("inf")):
+        completion[event.pid] = event.completion
+    return {
+        "incremental": completion,
+        "multicore": multicore(workload, policy, 1, time_quantum=time_quantum).completion.tolist(),
+    }
+
+
+# The vectorized batch engine on a one-workload batch, and partitioned replay split into
+# in-process chunks, on the workload as given; both must match the batch engine exactly
+def _check_batched(policy, workload, time_quantum, schedule):
+    from .batch import BATCH_POLICIES, Batch, run_batch
+    from .partition import PARTITION_POLICIES, replay
+
+    problems = []
+    baseline = schedule.completion.tolist()
+    if policy in BATCH_POLICIES:
+        completion = run_batch(policy, Batch.from_workloads([workload]), time_quantum)[0].tolist()
+        if completion != baseline:
+            problems.append(f"vectorized batch completion {completion} differs from batch engine {baseline}")
+    if policy in PARTITION_POLICIES:
+        replayed = replay(workload, policy, max_workers=1, chunks=len(workload), **_params(policy, time_quantum))
+        if replayed.completion.tolist() != baseline:
+            problems.append(f"partitioned completion {replayed.completion.tolist()} differs from batch engine {baseline}")
+        elif _segment_list(replayed) != _segment_list(schedule):
+            problems.append(f"partitioned segments {_segment_list(replayed)} differ from batch engine {_segment_list(schedule)}")
+    return problems
+
+
+def _records(workload):
+    return [Process(i, a, b, p) for i, (a, b, p) in
+            enumerate(zip(workload.arrival.tolist(), workload.burst.tolist(), workload.priority.tolist()))]
+
+
+def _streaming(policy, workload, time_quantum):
+    from .streaming import Completion, stream
+
+    completion = [0] * len(workload)
+    for event in stream(policy, _records(workload), time_quantum):
+        if isinstance(event, Completion):
+            completion[event.pid] = event.completion
+    return completion
+
+
+# The overhead engine on the workload as given: with no switch cost it must match the batch
+# engine, and with one a preemptive policy must still never run a process while a better one
+# waits (including one that arrived during the switch into it)
+def _check_overhead(policy, workload, time_quantum, baseline):
+    from .overhead import simulate
+
+    problems = []
+    completion = simulate(workload, policy, time_quantum).completion.tolist()
+    if completion != baseline:
+        problems.append(f"overhead completion {completion} differs from batch engine {baseline}")
+    if policy in KEYS and policy not in NONPREEMPTIVE:
+        switched = simulate(workload, policy, time_quantum, switch_cost=2)
+        problems += [f"with switch_cost=2: {problem}" for problem in check_ordering(switched, policy, time_quantum)]
+    return problems
+
+
+# Round-trip through a schedule trace with every time shifted past 2**53, which forces the wide
+# record format and catches any decoding that goes through floats
+def _check_trace(schedule):
+    import os
+    import tempfile
+
+    from .schedtrace import ScheduleTrace, write_schedule
+
+    shift = 2**53 + 1
+    segments = np.asarray(schedule.segments, dtype=np.int64).reshape(-1, 3) + [0, shift, shift]
+    shifted = Schedule(schedule.policy, schedule.workload, schedule.completion + shift, segments)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "trace.bin")
+        write_schedule(shifted, path)
+        with ScheduleTrace(path) as trace:
+            decoded = trace.to_schedule(schedule.workload)
+            problems = []
+            if trace.policy != schedule.policy:
+                problems.append(f"trace policy {trace.policy!r} differs from {schedule.policy!r}")
+            if decoded.segments.dtype != np.int64 or _segment_list(decoded) != _segment_list(shifted):
+                problems.append(f"wide trace segments {_segment_list(decoded)} differ from {_segment_list(shifted)}")
+    return problems
+
+
+def _params(policy, time_quantum):
+    if policy in ("rr", "stride", "lottery"):
+        return {"time_quantum": time_quantum}
+    if policy == "mlfq":
+        # Short levels and a boost period out of step with them, so small cases reach every rule
+        return {"quanta": (time_quantum, 2 * time_quantum), "boost_interval": 3 * time_quantum + 1}
+    return {}
+
+
+# Every check for one policy on one workload; returns a list of failures
+def check_case(policy, workload, time_quantum=5, differential=True):
+    params = _params(policy, time_quantum)
+    schedule = get_policy(policy)(workload, **params)
+    problems = check_invariants(schedule) + check_ordering(schedule, policy, time_quantum)
+    if not differential:
+        return problems
+    problems += _check_trace(schedule)
+    if policy not in REFERENCE_POLICIES:
+        return problems
+
+    expected = reference(policy, workload, **params)
+    if schedule.completion.tolist() != expected.completion.tolist():
+        problems.append(f"completion {schedule.completion.tolist()} differs from reference {expected.completion.tolist()}")
+    elif _segment_list(schedule) != _segment_list(expected):
+        problems.append(f"segments {_segment_list(schedule)} differ from reference {_segment_list(expected)}")
+    problems += _check_batched(policy, workload, time_quantum, schedule)
+
+    if policy not in STREAM_POLICIES:
+        return problems
+    baseline = schedule.completion.tolist()
+    problems += _check_overhead(policy, workload, time_quantum, baseline)
+    for engine, completion in _other_engines(policy, workload, time_quantum).items():
+        if completion != baseline:
+            problems.append(f"{engine} completion {completion} differs from batch engine {baseline}")
+
+    ordered = _sorted_by_arrival(workload)
+    baseline = get_policy(policy)(ordered, **_params(policy, time_quantum)).completion.tolist()
+    completion = _streaming(policy, ordered, time_quantum)
+    if completion != baseline:
+        problems.append(f"streaming completion {completion} differs from batch engine {baseline} on arrival-ordered input")
+    return problems
+
+
+# Greedily shrink a failing workload: drop processes, then lower values, while it still fails
+def shrink(policy, workload, time_quantum=5):
+    def build(columns):
+        return Workload(*columns[:3], deadline=columns[3])
+
+    def fails(columns):
+        return bool(check_case(policy, build(columns), time_quantum))
+
+    columns = [workload.arrival.tolist(), workload.burst.tolist(), workload.priority.tolist(), workload.deadline.tolist()]
+    progress = True
+    while progress:
+        progress = False
+        for i in range(len(columns[0])):
+            candidate = [column[:i] + column[i + 1:] for column in columns]
+            if candidate[0] and fails(candidate):
+                columns, progress = candidate, True
+                break
+        if progress:
+            continue
+        for c, floor in ((0, 0), (1, 1), (2, 0), (3, 0)):
+            for i, value in enumerate(columns[c]):
+                for smaller in sorted({floor, (value + floor) // 2, value - 1}):
+                    if floor <= smaller < value:
+                        candidate = [list(column) for column in columns]
+                        candidate[c][i] = smaller
+                        if fails(candidate):
+                            columns, progress = candidate, True
+                            break
+    return build(columns)
+
+
+# Run random cases round-robin over the policies; returns (cases run, failures)
+def run(cases=10000, seed=0, policies=VERIFY_POLICIES, max_processes=8, differential=True, stop_after=5):
+    rng = random.Random(seed)
+    failures = []
+    for case in range(cases):
+        policy = policies[case % len(policies)]
+        workload = random_workload(rng, max_processes)
+        time_quantum = rng.randint(1, 6)
+        problems = check_case(policy, workload, time_quantum, differential)
+        if problems:
+            minimal = shrink(policy, workload, time_quantum)
+            failures.append((policy, time_quantum, minimal, check_case(policy, minimal, time_quantum, differential)))
+            if len(failures) >= stop_after:
+                return case + 1, failures
+    return cases, failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the scheduling engines against invariants and a reference simulator")
+    parser.add_argument("--cases", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--policy", action="append", choices=VERIFY_POLICIES, help="policy to check (repeatable; default: all)")
+    parser.add_argument("--max-processes", type=int, default=8)
+    parser.add_argument("--no-differential", action="store_true", help="check invariants and ordering only")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    count, failures = run(args.cases, args.seed, tuple(args.policy or VERIFY_POLICIES), args.max_processes,
+                          not args.no_differential)
+    for policy, time_quantum, workload, problems in failures:
+        print(f"FAIL {policy} (time_quantum={time_quantum})")
+        print(f"  arrival={workload.arrival.tolist()} burst={workload.burst.tolist()} priority={workload.priority.tolist()} "
+              f"deadline={workload.deadline.tolist()}")
+        for problem in problems:
+            print(f"  {problem}")
+    print(f"{count} cases, {len(failures)} failures in {time.perf_counter() - started:.1f}s")
+    raise SystemExit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
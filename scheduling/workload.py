@@ -0,0 +1,67 @@
+import numpy as np
+
+from .process import Process
+
+
+# Columnar batch of processes: one NumPy array per attribute instead of one object per process
+class Workload:
+    __slots__ = ("pid", "arrival", "burst", "priority", "names", "deadline")
+
+    def __init__(self, arrival, burst, priority=None, pid=None, names=None, deadline=None):
+        self.arrival = np.ascontiguousarray(arrival, dtype=np.int64)
+        self.burst = np.ascontiguousarray(burst, dtype=np.int64)
+        n = len(self.arrival)
+        if len(self.burst) != n:
+            raise ValueError("arrival and burst columns must have the same length")
+        if n and (self.burst <= 0).any():
+            raise ValueError("burst times must be positive")
+        if n and (self.arrival < 0).any():
+            raise ValueError("arrival times must not be negative")
+
+        # Lower value is higher priority
+        self.priority = np.zeros(n, dtype=np.int32) if priority is None else np.ascontiguousarray(priority, dtype=np.int32)
+        # Index into names; process i is labelled names[pid[i]], or P<pid + 1> without a names table
+        self.pid = np.arange(n, dtype=np.int32) if pid is None else np.ascontiguousarray(pid, dtype=np.int32)
+        if len(self.priority) != n or len(self.pid) != n:
+            raise ValueError("priority and pid columns must have the same length as arrival")
+        self.names = None if names is None else tuple(names)
+        # Optional absolute completion deadlines, used by the deadline policies and lateness metrics
+        self.deadline = None if deadline is None else np.ascontiguousarray(deadline, dtype=np.int64)
+        if self.deadline is not None and len(self.deadline) != n:
+            raise ValueError("deadline column must have the same length as arrival")
+
+    @classmethod
+    def from_processes(cls, processes):
+        processes = list(processes)
+        deadlines = [p.deadline for p in processes]
+        has_deadlines = any(deadline is not None for deadline in deadlines)
+        if has_deadlines and None in deadlines:
+            raise ValueError("either every process or none must have a deadline")
+        return cls(
+            [p.arrival for p in processes],
+            [p.burst for p in processes],
+            [p.priority for p in processes],
+            names=[p.pid for p in processes],
+            deadline=deadlines if has_deadlines else None,
+        )
+
+    def __len__(self):
+        return len(self.arrival)
+
+    # Label of the process at the given position
+    def name(self, index):
+        pid = int(self.pid[index])
+        return self.names[pid] if self.names is not None else f"P{pid + 1}"
+
+    # Process records for display, one per row
+    def records(self):
+        deadlines = self.deadline.tolist() if self.deadline is not None else [None] * len(self)
+        for i, (arrival, burst, priority, deadline) in enumerate(zip(self.arrival.tolist(), self.burst.tolist(), self.priority.tolist(), deadlines)):
+            yield Process(self.name(i), arrival, burst, priority, deadline)
+
+
+# Accept either a Workload or an iterable of Process records
+def as_workload(processes):
+    if isinstance(processes, Workload):
+        return processes
+    return Workload.from_processes(processes)